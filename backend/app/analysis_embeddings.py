@@ -0,0 +1,125 @@
+# backend/app/analysis_embeddings.py
+"""
+Embeddings stored on Analysis rows.
+
+Vectors are kept as float16 blobs (768 bytes for MiniLM) with the ID of the
+model that produced them, so stored JDs and resumes can be compared or
+re-scored without running SBERT again. load_embeddings reads a column
+straight into one (n, dims) array.
+
+Backfill rows saved before embeddings were stored (from backend/):
+    python -m app.analysis_embeddings backfill [--batch-size 256]
+Only JDs can be backfilled: the resume text is not stored on the row.
+"""
+import argparse
+import time
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from .embeddings import SBERT_MODEL_ID, encode_texts
+from .models import Analysis
+
+EMBEDDING_DTYPE = np.dtype("<f2")
+
+
+def pack_embedding(vector: np.ndarray) -> bytes:
+    return np.asarray(vector, dtype=EMBEDDING_DTYPE).tobytes()
+
+
+def unpack_embeddings(blobs: list[bytes]) -> np.ndarray:
+    """Equal-length blobs -> (n, dims) float32 array, decoded in one call."""
+    if not blobs:
+        return np.zeros((0, 0), dtype=np.float32)
+    dims = len(blobs[0]) // EMBEDDING_DTYPE.itemsize
+    return np.frombuffer(b"".join(blobs), dtype=EMBEDDING_DTYPE).reshape(-1, dims).astype(np.float32)
+
+
+def embed_analysis(resume_text: str, jd_text: str) -> dict:
+    """Column values for an Analysis row's embeddings (empty if the model is unavailable)."""
+    # Lowercased like compute_score, so these are embedding-cache hits
+    vectors = encode_texts([(resume_text or "").lower(), (jd_text or "").lower()])
+    if vectors is None:
+        return {}
+    return {
+        "resume_embedding": pack_embedding(vectors[0]),
+        "jd_embedding": pack_embedding(vectors[1]),
+        "embedding_model": SBERT_MODEL_ID,
+    }
+
+
+def load_embeddings(db: Session, column: str = "jd_embedding", user_id: int | None = None,
+                    model_id: str = SBERT_MODEL_ID, ids=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (analysis ids, (n, dims) float32 matrix) for rows with a stored ``column``
+    embedding from ``model_id``, optionally limited to one user or to ``ids``.
+    """
+    col = getattr(Analysis, column)
+    query = db.query(Analysis.id, col).filter(col.isnot(None), Analysis.embedding_model == model_id)
+    if user_id is not None:
+        query = query.filter(Analysis.user_id == user_id)
+    if ids is not None:
+        query = query.filter(Analysis.id.in_(list(ids)))
+    rows = query.order_by(Analysis.id).all()
+    ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    return ids, unpack_embeddings([r[1] for r in rows])
+
+
+def backfill(db: Session, batch_size: int = 256) -> dict:
+    """Embed job_description for rows without a JD embedding from the current model."""
+    start = time.perf_counter()
+    done = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Analysis)
+            .filter(
+                Analysis.id > last_id,
+                (Analysis.jd_embedding.is_(None)) | (Analysis.embedding_model != SBERT_MODEL_ID)
+                | (Analysis.embedding_model.is_(None)),
+            )
+            .order_by(Analysis.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+        last_id = rows[-1].id
+        vectors = encode_texts([(r.job_description or "").lower() for r in rows])
+        if vectors is None:
+            raise RuntimeError("SBERT model not available")
+        for row, vector in zip(rows, vectors):
+            if row.embedding_model != SBERT_MODEL_ID:
+                # A resume vector from another model can't sit next to this one
+                row.resume_embedding = None
+            row.jd_embedding = pack_embedding(vector)
+            row.embedding_model = SBERT_MODEL_ID
+        db.commit()
+        done += len(rows)
+        rate = done / (time.perf_counter() - start)
+        print(f"  {done} rows embedded ({rate:.1f} rows/sec)")
+
+    elapsed = time.perf_counter() - start
+    print(f"Backfilled {done} JD embeddings in {elapsed:.1f}s")
+    return {"rows": done, "elapsed_s": round(elapsed, 2)}
+
+
+def main(argv=None):
+    from .database import SessionLocal, init_db
+
+    ap = argparse.ArgumentParser(description="Manage embeddings stored on analyses.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    fill = sub.add_parser("backfill", help="embed JDs of rows saved without embeddings")
+    fill.add_argument("--batch-size", type=int, default=256)
+    args = ap.parse_args(argv)
+
+    init_db()
+    db = SessionLocal()
+    try:
+        backfill(db, args.batch_size)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
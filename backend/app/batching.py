@@ -0,0 +1,128 @@
+# backend/app/batching.py
+
+import queue
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import Future
+from typing import Callable
+
+import numpy as np
+
+
+class Histogram:
+    """Fixed-bucket histogram; bucket i counts values <= bounds[i], the last one the rest."""
+
+    def __init__(self, bounds: list[float]):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += 1
+        self.sum += value
+
+    def snapshot(self) -> dict:
+        labels = [f"<={b:g}" for b in self.bounds] + [f">{self.bounds[-1]:g}"]
+        return {
+            "count": self.total,
+            "mean": round(self.sum / self.total, 3) if self.total else 0.0,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class MicroBatcher:
+    """
+    Coalesces encode calls from concurrent threads into batched calls.
+
+    Callers block in encode(); a single background thread takes the first
+    waiting request, keeps collecting until ``max_batch_size`` texts are
+    queued or ``max_wait_ms`` has passed since that request arrived, runs
+    ``encode_fn`` once on all of them and hands each caller its rows. Texts
+    repeated within a batch are encoded once. A request larger than the
+    batch size is encoded on its own.
+    """
+
+    def __init__(self, encode_fn: Callable[[list[str]], np.ndarray], max_batch_size: int = 32,
+                 max_wait_ms: float = 2.0):
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        # Request that didn't fit the previous batch; opens the next one
+        self._carry = None
+        self.batch_sizes = Histogram([1, 2, 4, 8, 16, 32, 64, 128])
+        self.queue_wait_ms = Histogram([0.5, 1, 2, 5, 10, 20, 50, 100])
+        self.batches = 0
+        self.deduplicated = 0
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="sbert-batcher", daemon=True)
+                    self._thread.start()
+        future: Future = Future()
+        self._queue.put((list(texts), time.perf_counter(), future))
+        return future.result()
+
+    def _collect(self) -> list:
+        first, self._carry = self._carry or self._queue.get(), None
+        batch = [first]
+        size = len(first[0])
+        deadline = first[1] + self.max_wait
+        while size < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if size + len(request[0]) > self.max_batch_size:
+                # Doesn't fit: flush now and start the next batch with it
+                self._carry = request
+                break
+            batch.append(request)
+            size += len(request[0])
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+            texts = [t for request, _, _ in batch for t in request]
+            unique = list(dict.fromkeys(texts))
+            with self._lock:
+                self.batches += 1
+                self.deduplicated += len(texts) - len(unique)
+                self.batch_sizes.observe(len(unique))
+                for _, queued_at, _ in batch:
+                    self.queue_wait_ms.observe((started - queued_at) * 1000)
+            try:
+                vectors = self.encode_fn(unique)
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                continue
+            if len(unique) < len(texts):
+                position = {t: i for i, t in enumerate(unique)}
+                vectors = vectors[[position[t] for t in texts]]
+            row = 0
+            for request, _, future in batch:
+                future.set_result(vectors[row:row + len(request)])
+                row += len(request)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+                "batches": self.batches,
+                "deduplicated": self.deduplicated,
+                "queued": self._queue.qsize(),
+                "batch_size": self.batch_sizes.snapshot(),
+                "queue_wait_ms": self.queue_wait_ms.snapshot(),
+            }
@@ -0,0 +1,275 @@
+# backend/app/cache.py
+
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+
+def content_hash(content: bytes) -> str:
+    """Stable content address for an uploaded document."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class ParseCache:
+    """
+    Two-tier cache for parse_resume results, keyed by document hash.
+
+    Memory tier: bounded LRU (OrderedDict).
+    Disk tier (optional): one JSON file per entry under ``disk_dir``; it
+    survives restarts. Every key is namespaced with ``version`` (parser +
+    taxonomy), so a version bump makes old entries unreachable. ``version``
+    may be a callable, read on every lookup, for versions that change at
+    runtime (taxonomy hot reload).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        disk_dir: str | None = None,
+        version: str | Callable[[], str] = "",
+    ):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.version = version
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @property
+    def current_version(self) -> str:
+        return self.version() if callable(self.version) else self.version
+
+    def _key(self, digest: str) -> str:
+        version = self.current_version
+        return f"{version}-{digest}" if version else digest
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _remember(self, key: str, result: dict) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, digest: str) -> dict | None:
+        key = self._key(digest)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(result)
+
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), "r", encoding="utf-8") as f:
+                    result = json.load(f)
+            except (OSError, ValueError):
+                result = None
+            if result is not None:
+                self._remember(key, result)
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return copy.deepcopy(result)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, digest: str, result: dict) -> None:
+        key = self._key(digest)
+        self._remember(key, copy.deepcopy(result))
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(result, f)
+                os.replace(tmp_path, path)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Parse cache disk write failed: {e}")
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.current_version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk_enabled": bool(self.disk_dir),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class EmbeddingCache:
+    """
+    Cache of text embeddings, keyed by model ID + normalized-text hash.
+
+    Memory tier: LRU bounded by ``max_bytes`` of vector data.
+    Disk tier (optional): one append-only file of fixed-size records
+    (64-byte hex key + float32 vector) per model, memory-mapped when it is
+    opened. Opening indexes every stored key, so anything encoded by an
+    earlier run is served without touching the model again.
+    """
+
+    def __init__(self, model_id: str, max_bytes: int = 64 * 1024 * 1024, disk_dir: str | None = None):
+        self.model_id = model_id
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._disk_path: str | None = None
+        self._disk_dtype: np.dtype | None = None
+        self._disk_rows: dict[str, int] = {}
+        self._disk_map: np.memmap | None = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def key(self, text: str) -> str:
+        """Hash of the model ID and whitespace-normalized text."""
+        return hashlib.sha256(f"{self.model_id}\0{text}".encode("utf-8")).hexdigest()
+
+    def open_disk(self, dims: int) -> int:
+        """Open (and index) the on-disk store for ``dims``-wide vectors; returns its size."""
+        if not self.disk_dir:
+            return 0
+        os.makedirs(self.disk_dir, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", self.model_id)
+        path = os.path.join(self.disk_dir, f"{slug}-{dims}d.emb")
+        dtype = np.dtype([("key", "S64"), ("vec", "<f4", (dims,))])
+        with self._lock:
+            self._disk_path = path
+            self._disk_dtype = dtype
+            self._remap()
+            return len(self._disk_rows)
+
+    @property
+    def disk_open(self) -> bool:
+        return self._disk_path is not None
+
+    def _remap(self) -> None:
+        # Caller holds the lock. A trailing partial record (interrupted
+        # write) is dropped so later appends stay aligned.
+        self._disk_rows = {}
+        self._disk_map = None
+        try:
+            size = os.path.getsize(self._disk_path)
+        except OSError:
+            return
+        rows, partial = divmod(size, self._disk_dtype.itemsize)
+        if partial:
+            try:
+                os.truncate(self._disk_path, rows * self._disk_dtype.itemsize)
+            except OSError as e:
+                print(f"Embedding cache could not drop partial record: {e}")
+        if rows:
+            self._disk_map = np.memmap(self._disk_path, dtype=self._disk_dtype, mode="r", shape=(rows,))
+            self._disk_rows = {k.decode("ascii"): i for i, k in enumerate(self._disk_map["key"])}
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._entries[key] = vector
+            self._bytes += vector.nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def get(self, key: str) -> np.ndarray | None:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return vector
+            row = self._disk_rows.get(key)
+            if row is not None:
+                if self._disk_map is None or row >= len(self._disk_map):
+                    self._disk_map = np.memmap(self._disk_path, dtype=self._disk_dtype, mode="r",
+                                               shape=(row + 1,))
+                vector = np.array(self._disk_map[row]["vec"], dtype=np.float32)
+                vector.flags.writeable = False
+                self.hits += 1
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+        if vector is not None:
+            self._remember(key, vector)
+        return vector
+
+    def put(self, key: str, vector: np.ndarray) -> None:
+        vector = np.array(vector, dtype=np.float32)
+        vector.flags.writeable = False
+        self._remember(key, vector)
+
+        if self._disk_path is None or vector.shape != self._disk_dtype["vec"].shape:
+            return
+        record = np.zeros(1, dtype=self._disk_dtype)
+        record["key"] = key.encode("ascii")
+        record["vec"] = vector
+        with self._lock:
+            if key in self._disk_rows:
+                return
+            try:
+                # One O_APPEND write per record, so processes sharing the
+                # store don't interleave partial records.
+                fd = os.open(self._disk_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, record.tobytes())
+                    end = os.lseek(fd, 0, os.SEEK_CUR)
+                finally:
+                    os.close(fd)
+                self._disk_rows[key] = end // self._disk_dtype.itemsize - 1
+            except OSError as e:
+                print(f"Embedding cache disk write failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "model": self.model_id,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "disk_enabled": bool(self.disk_dir),
+                "disk_entries": len(self._disk_rows),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 from .models import Base
 import os
@@ -15,11 +15,30 @@ DATABASE_URL = os.getenv(
 engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _add_missing_columns():
+    """
+    create_all never alters existing tables, so add any nullable columns the
+    models gained since a table was created.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                col_type = column.type.compile(dialect=engine.dialect)
+                print(f"   -> Adding column {table.name}.{column.name} ({col_type})")
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}'))
+
 # Create all tables
 def init_db():
     print("   -> Calling Base.metadata.create_all...")
     try:
         Base.metadata.create_all(bind=engine)
+        _add_missing_columns()
         print("   -> Base.metadata.create_all done.")
     except Exception as e:
         print(f"   -> ERROR in init_db: {e}")
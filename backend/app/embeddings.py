@@ -0,0 +1,259 @@
+# backend/app/embeddings.py
+
+import os
+import threading
+from bisect import bisect_left
+from concurrent.futures import Future
+
+import numpy as np
+from dotenv import load_dotenv
+
+from .batching import MicroBatcher
+from .cache import EmbeddingCache
+from .sections import section_boundaries
+
+load_dotenv()
+
+SBERT_MODEL_NAME = os.getenv("SBERT_MODEL_NAME", "all-MiniLM-L6-v2")
+# "torch" (sentence-transformers) or "onnx" (ONNX Runtime, see app.onnx_encoder)
+SBERT_BACKEND = os.getenv("SBERT_BACKEND", "torch").lower()
+SBERT_ONNX_DIR = os.getenv("SBERT_ONNX_DIR", "onnx_model")
+SBERT_ONNX_QUANTIZED = os.getenv("SBERT_ONNX_QUANTIZED", "0").lower() in ("1", "true", "yes")
+# Vectors from different backends differ slightly, so they are cached apart
+SBERT_MODEL_ID = SBERT_MODEL_NAME if SBERT_BACKEND != "onnx" else (
+    f"{SBERT_MODEL_NAME}+onnx" + ("-int8" if SBERT_ONNX_QUANTIZED else "")
+)
+
+# Long-document mode: embed every token-budgeted chunk of a text (split along
+# resume sections) and pool them, instead of only the first max_seq_length
+# tokens the encoder sees.
+EMBED_LONG_DOCS = os.getenv("EMBED_LONG_DOCS", "0").lower() in ("1", "true", "yes")
+EMBED_MAX_CHUNKS = int(os.getenv("EMBED_MAX_CHUNKS", 16))
+# Whitespace-normalized text averages 4-5 characters per wordpiece; cutting at
+# 12 per token leaves the encoder's window intact while sparing the tokenizer
+# the rest of a long resume.
+_MAX_CHARS_PER_TOKEN = 12
+
+# Micro-batching of encodes from concurrent requests (SBERT_BATCH_WAIT_MS=0
+# disables it and every caller encodes on its own)
+SBERT_BATCH_SIZE = int(os.getenv("SBERT_BATCH_SIZE", 32))
+SBERT_BATCH_WAIT_MS = float(os.getenv("SBERT_BATCH_WAIT_MS", 2))
+
+embedding_cache = EmbeddingCache(
+    SBERT_MODEL_ID,
+    max_bytes=int(float(os.getenv("EMBEDDING_CACHE_MB", 64)) * 1024 * 1024),
+    disk_dir=os.getenv("EMBEDDING_CACHE_DIR") or None,
+)
+
+# SBERT Model Loading
+_sbert_model = None
+
+
+def get_sbert_model():
+    """
+    The loaded encoder, or None if sentence-transformers can't load.
+
+    A configured ONNX export that fails to load raises instead: that is a
+    deployment error, and scoring on with zero similarity would hide it.
+    """
+    global _sbert_model
+    if _sbert_model is None:
+        try:
+            print(f"Loading SBERT model ({SBERT_MODEL_ID})...")
+            if SBERT_BACKEND == "onnx":
+                from .onnx_encoder import OnnxSentenceEncoder
+
+                _sbert_model = OnnxSentenceEncoder(SBERT_ONNX_DIR, quantized=SBERT_ONNX_QUANTIZED)
+            else:
+                from sentence_transformers import SentenceTransformer
+
+                _sbert_model = SentenceTransformer(SBERT_MODEL_NAME)
+            print("SBERT model loaded!")
+        except Exception as e:
+            print(f"Failed to load SBERT model: {e}")
+            if SBERT_BACKEND == "onnx":
+                raise RuntimeError(f"SBERT_BACKEND=onnx but the model in {SBERT_ONNX_DIR} "
+                                   f"could not be loaded: {e}") from e
+            return None
+    return _sbert_model
+
+
+def _encode_batch(texts: list[str]) -> np.ndarray:
+    return np.asarray(
+        get_sbert_model().encode(texts, batch_size=SBERT_BATCH_SIZE, convert_to_numpy=True,
+                                 normalize_embeddings=True),
+        dtype=np.float32,
+    )
+
+
+encode_batcher = MicroBatcher(_encode_batch, SBERT_BATCH_SIZE, SBERT_BATCH_WAIT_MS)
+
+
+def warm_embedding_cache() -> int:
+    """Load the model and index the on-disk embedding store; returns stored vectors."""
+    model = get_sbert_model()
+    if model is None or not embedding_cache.disk_dir or embedding_cache.disk_open:
+        return 0
+    stored = embedding_cache.open_disk(model.get_sentence_embedding_dimension())
+    print(f"Embedding cache warmed: {stored} stored vectors")
+    return stored
+
+
+def _normalize(text: str) -> str:
+    # Whitespace never changes the tokens, so it doesn't change the vector
+    return " ".join(text.split())
+
+
+def _pretruncate(text: str, tokens: int) -> str:
+    return text[:tokens * _MAX_CHARS_PER_TOKEN]
+
+
+def chunk_text(text: str, tokenizer, budget: int, max_chunks: int = EMBED_MAX_CHUNKS) -> list[tuple[str, int]]:
+    """
+    Split text into (chunk, token_count) pieces of at most ``budget`` tokens.
+
+    Chunks follow resume sections: adjacent sections share a chunk while they
+    fit, and a section longer than the budget is cut at the last line break
+    that keeps the chunk at least half full. At most ``max_chunks`` are kept.
+    """
+    text = _pretruncate(text, budget * max_chunks)
+    offsets = [
+        (a, b) for a, b in tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+        if b > a
+    ]
+    if not offsets:
+        return []
+    starts = [a for a, _ in offsets]
+
+    # Token ranges, one or more per section
+    pieces = []
+    bounds = section_boundaries(text) + [len(text)]
+    for s, e in zip(bounds, bounds[1:]):
+        i, j = bisect_left(starts, s), bisect_left(starts, e)
+        while i < j:
+            end = min(i + budget, j)
+            if end < j:
+                for t in range(end, i + budget // 2, -1):
+                    if "\n" in text[offsets[t - 1][1]:offsets[t][0]]:
+                        end = t
+                        break
+            pieces.append((i, end))
+            i = end
+
+    merged = [pieces[0]]
+    for i, end in pieces[1:]:
+        if end - merged[-1][0] <= budget:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((i, end))
+
+    return [
+        (text[offsets[i][0]:offsets[end - 1][1]], end - i)
+        for i, end in merged[:max_chunks]
+    ]
+
+
+# Texts being encoded right now (cache key -> Future of the vector), so a
+# text missing from the cache in several threads at once is encoded once
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _encode_cached(texts: list[str]) -> np.ndarray:
+    texts = [_normalize(t) for t in texts]
+    keys = [embedding_cache.key(t) for t in texts]
+    owned: dict[str, str] = {}
+    waiting: dict[str, Future] = {}
+    # Cache lookups and in-flight registration happen together, so a text
+    # can't slip between another thread's put and its leaving _inflight
+    with _inflight_lock:
+        vectors = [embedding_cache.get(k) for k in keys]
+        for key, text, vector in zip(keys, texts, vectors):
+            if vector is not None or key in owned or key in waiting:
+                continue
+            future = _inflight.get(key)
+            if future is None:
+                _inflight[key] = Future()
+                owned[key] = text
+            else:
+                waiting[key] = future
+    if not owned and not waiting:
+        return np.vstack(vectors)
+
+    fresh: dict[str, np.ndarray] = {}
+    if owned:
+        try:
+            if SBERT_BATCH_WAIT_MS > 0:
+                encoded = encode_batcher.encode(list(owned.values()))
+            else:
+                encoded = _encode_batch(list(owned.values()))
+        except BaseException as e:
+            with _inflight_lock:
+                for key in owned:
+                    _inflight.pop(key).set_exception(e)
+            raise
+        fresh = dict(zip(owned, encoded))
+        for key, vector in fresh.items():
+            embedding_cache.put(key, vector)
+        with _inflight_lock:
+            for key, vector in fresh.items():
+                _inflight.pop(key).set_result(vector)
+    for key, future in waiting.items():
+        fresh[key] = future.result()
+    vectors = [fresh[k] if v is None else v for k, v in zip(keys, vectors)]
+    return np.vstack(vectors)
+
+
+def encode_texts(texts: list[str], long_docs: bool | None = None) -> np.ndarray | None:
+    """
+    Embed texts in one batched call.
+
+    Returns unit-normalized float32 rows (so cosine similarity is a dot
+    product), or None if the model is unavailable. Vectors come from
+    embedding_cache when possible; only texts never seen before are encoded,
+    batched with other threads' encodes by encode_batcher. A text another
+    thread is already encoding is waited for, not encoded again.
+
+    With ``long_docs`` (default EMBED_LONG_DOCS), every text is chunked with
+    chunk_text, the chunks of all texts are encoded (and cached) together,
+    and each text's vector is the token-weighted mean of its chunks.
+    Otherwise texts are cut to what the encoder reads before tokenizing.
+    """
+    model = get_sbert_model()
+    if model is None:
+        return None
+    if embedding_cache.disk_dir and not embedding_cache.disk_open:
+        warm_embedding_cache()
+    if not texts:
+        return np.zeros((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+    max_tokens = model.max_seq_length
+    if not (EMBED_LONG_DOCS if long_docs is None else long_docs):
+        return _encode_cached([_pretruncate(_normalize(t), max_tokens) for t in texts])
+
+    # Room for the [CLS]/[SEP] tokens the encoder adds
+    budget = max_tokens - 2
+    chunked = [chunk_text(t, model.tokenizer, budget) or [(t, 1)] for t in texts]
+    vectors = _encode_cached([c for chunks in chunked for c, _ in chunks])
+
+    pooled = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+    row = 0
+    for n, chunks in enumerate(chunked):
+        weights = np.array([tokens for _, tokens in chunks], dtype=np.float32)
+        mean = weights @ vectors[row:row + len(chunks)]
+        pooled[n] = mean / (np.linalg.norm(mean) or 1.0)
+        row += len(chunks)
+    return pooled
+
+
+def get_similarity(text1, text2):
+    """Semantic similarity using Sentence-Transformers (Deep Learning)"""
+    try:
+        embeddings = encode_texts([text1, text2])
+        if embeddings is None:
+            print("SBERT model not available, returning 0.0")
+            return 0.0
+        return float(embeddings[0] @ embeddings[1])
+    except Exception as e:
+        print(f"Similarity error: {e}")
+        return 0.0
@@ -0,0 +1,76 @@
+# backend/app/executor.py
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Scoring calls running at once, and how many more may wait for a slot
+SCORING_WORKERS = int(os.getenv("SCORING_WORKERS", min(4, os.cpu_count() or 1)))
+SCORING_QUEUE_DEPTH = int(os.getenv("SCORING_QUEUE_DEPTH", 32))
+SCORING_RETRY_AFTER = int(os.getenv("SCORING_RETRY_AFTER", 2))
+
+
+class ExecutorBusy(Exception):
+    """Every worker is busy and the queue is full; the caller should retry later."""
+
+
+class BoundedExecutor:
+    """
+    Thread pool for blocking work called from async endpoints.
+
+    At most ``max_workers`` calls run at once and at most ``max_queue`` wait
+    behind them; past that, run() fails fast with ExecutorBusy instead of
+    letting latency grow without bound.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, name: str = "executor"):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self.completed += 1
+
+    async def run(self, fn, *args, **kwargs):
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise ExecutorBusy(f"Server busy: {self._in_flight} requests in progress, try again shortly")
+            self._in_flight += 1
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "running": min(self._in_flight, self.max_workers),
+                "queued": max(0, self._in_flight - self.max_workers),
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+
+scoring_executor = BoundedExecutor(SCORING_WORKERS, SCORING_QUEUE_DEPTH, name="scoring")
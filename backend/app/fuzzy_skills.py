@@ -0,0 +1,173 @@
+# backend/app/fuzzy_skills.py
+"""
+Embedding-based fuzzy skill normalization (optional, FUZZY_SKILLS=1).
+
+Exact matching only knows the taxonomy's aliases, so "Postgres" or
+"PyTorch Lightning" are missed. This stage takes the short phrases of a
+resume's skills section that are not aliases, embeds them in one batch and
+maps each to its nearest taxonomy term with a single matrix multiply against
+a precomputed embedding matrix of every alias. The matrix is built once per
+taxonomy version and model, and cached on disk under SKILL_EMBEDDINGS_DIR.
+Phrases go through encode_texts, so they share the embedding cache and the
+micro-batcher with scoring.
+"""
+import os
+import re
+import threading
+
+import numpy as np
+from dotenv import load_dotenv
+
+from .embeddings import encode_texts, SBERT_MODEL_ID
+from .sections import section_text
+from .taxonomy import Taxonomy, get_taxonomy
+
+load_dotenv()
+
+FUZZY_SKILLS = os.getenv("FUZZY_SKILLS", "0").lower() in ("1", "true", "yes")
+# Minimum cosine similarity for a phrase to be mapped to a skill
+FUZZY_SKILL_THRESHOLD = float(os.getenv("FUZZY_SKILL_THRESHOLD", 0.8))
+# Upper bound on phrases embedded per resume, which bounds the stage's cost
+FUZZY_MAX_CANDIDATES = int(os.getenv("FUZZY_MAX_CANDIDATES", 64))
+SKILL_EMBEDDINGS_DIR = os.getenv("SKILL_EMBEDDINGS_DIR", "skill_embeddings")
+
+# Skill lists are separated by punctuation, bullets, line breaks or "and"
+_SPLIT_RE = re.compile(r"[\n\t,;|•·●▪◦*()\[\]]|\s[-–/&]\s|\s+and\s+")
+_STRIP_CHARS = " .:-–—/"
+_MAX_WORDS = 4
+
+
+def cache_tag() -> str:
+    """Parse-cache version component, so results are not reused across settings."""
+    return f"-f{FUZZY_SKILL_THRESHOLD}" if FUZZY_SKILLS else ""
+
+
+def candidate_phrases(text: str, sections: dict, taxonomy: Taxonomy) -> list[str]:
+    """
+    Short skill-like phrases that the exact matcher did not resolve.
+
+    Read from the skills section when one was found, else the whole text;
+    sentences are dropped by the word limit.
+    """
+    source = section_text(text, sections, "skills") or text
+    seen: set[str] = set()
+    phrases = []
+    for part in _SPLIT_RE.split(source.lower()):
+        phrase = " ".join(part.split()).strip(_STRIP_CHARS)
+        if (
+            len(phrase) < 2
+            or len(phrase.split()) > _MAX_WORDS
+            or not any(ch.isalpha() for ch in phrase)
+            or phrase in taxonomy.aliases
+            or phrase in seen
+        ):
+            continue
+        seen.add(phrase)
+        phrases.append(phrase)
+        if len(phrases) >= FUZZY_MAX_CANDIDATES:
+            break
+    return phrases
+
+
+def _encode(texts: list[str]) -> np.ndarray | None:
+    # Terms and phrases are a few words, never long documents
+    return encode_texts(texts, long_docs=False)
+
+
+class SkillEmbeddingIndex:
+    """Unit-normalized embeddings of every taxonomy term; row i belongs to ``skills[i]``."""
+
+    def __init__(self, terms: list[str], skills: list[str], matrix: np.ndarray, version: str):
+        self.terms = terms
+        self.skills = skills
+        self.matrix = matrix
+        self.version = version
+
+    @classmethod
+    def build(cls, taxonomy: Taxonomy, cache_dir: str | None = SKILL_EMBEDDINGS_DIR):
+        """The index for ``taxonomy``, loaded from ``cache_dir`` or encoded (None without a model)."""
+        terms = sorted(taxonomy.aliases)
+        skills = [taxonomy.aliases[t] for t in terms]
+        path = None
+        if cache_dir:
+            slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", SBERT_MODEL_ID)
+            path = os.path.join(cache_dir, f"{slug}-{taxonomy.version}.npz")
+            try:
+                with np.load(path) as cached:
+                    if list(cached["terms"]) == terms:
+                        return cls(terms, skills, cached["matrix"], taxonomy.version)
+            except (OSError, KeyError, ValueError):
+                pass
+
+        matrix = _encode(terms)
+        if matrix is None:
+            return None
+        if path:
+            tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                np.savez(tmp_path, terms=np.array(terms), matrix=matrix)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"Skill embedding cache write failed: {e}")
+        return cls(terms, skills, matrix, taxonomy.version)
+
+    def nearest(self, vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """(row index, cosine similarity) of the closest term for each vector."""
+        sims = vectors @ self.matrix.T
+        best = sims.argmax(axis=1)
+        return best, sims[np.arange(len(best)), best]
+
+
+_index: SkillEmbeddingIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_skill_index(taxonomy: Taxonomy) -> SkillEmbeddingIndex | None:
+    """The embedding index for ``taxonomy``, rebuilt (or loaded from disk) when it changes."""
+    global _index
+    index = _index
+    if index is None or index.version != taxonomy.version:
+        with _index_lock:
+            if _index is None or _index.version != taxonomy.version:
+                _index = SkillEmbeddingIndex.build(taxonomy)
+            index = _index
+    return index
+
+
+def fuzzy_match(phrases: list[str], taxonomy: Taxonomy | None = None) -> list[dict]:
+    """Map phrases to canonical skills; returns [{"term", "skill", "score"}] above the threshold."""
+    if not phrases:
+        return []
+    index = get_skill_index(taxonomy or get_taxonomy())
+    vectors = _encode(phrases) if index is not None else None
+    if vectors is None:
+        return []
+    best, scores = index.nearest(vectors)
+    return [
+        {"term": phrase, "skill": index.skills[i], "score": round(float(score), 4)}
+        for phrase, i, score in zip(phrases, best, scores)
+        if score >= FUZZY_SKILL_THRESHOLD
+    ]
+
+
+def add_fuzzy_skills(parsed: dict) -> dict:
+    """
+    Add fuzzy-matched skills to a parse_resume result, in place.
+
+    No-op unless FUZZY_SKILLS is enabled. Matches are merged into "skills"
+    and listed under "fuzzy_skills" so they can be told apart.
+    """
+    if not FUZZY_SKILLS:
+        return parsed
+    taxonomy = get_taxonomy()
+    text = parsed.get("full_text") or ""
+    sections = {k: tuple(v) for k, v in (parsed.get("sections") or {}).items()}
+    try:
+        matches = fuzzy_match(candidate_phrases(text, sections, taxonomy), taxonomy)
+    except Exception as e:
+        print(f"Fuzzy skill normalization failed: {e}")
+        return parsed
+    parsed["skills"] = sorted(set(parsed.get("skills") or []) | {m["skill"] for m in matches})
+    parsed["fuzzy_skills"] = matches
+    return parsed
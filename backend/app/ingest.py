@@ -0,0 +1,188 @@
+# backend/app/ingest.py
+"""
+Bulk resume ingestion: parse a directory or zip of PDFs into JSONL.
+
+Usage (from backend/):
+    python -m app.ingest resumes/ -o parsed.jsonl
+    python -m app.ingest archive.zip -o parsed.jsonl --workers 8 --no-full-text
+
+Documents are parsed across all cores by a ParserPool, with the same
+per-document time and memory limits as uploads (PARSER_TIMEOUT,
+PARSER_MEMORY_MB; --timeout/--memory-mb), so a pathological PDF becomes an
+error record instead of stalling the run. Each result is appended to the
+output as soon as it finishes. Re-running with the same output file skips
+documents already recorded there, so an interrupted run picks up where it
+stopped. A throughput report (docs/sec, p50/p95 per doc) is printed at the end.
+
+Names are extracted per document inside the workers, in parallel, rather
+than with parser.extract_names: batching NER in this process would run it
+on one core while the workers sit idle.
+"""
+import argparse
+import json
+import os
+import time
+import zipfile
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .cache import content_hash
+from .workers import PARSER_MEMORY_MB, PARSER_TIMEOUT, ParserPool
+
+def _read_document(archive: zipfile.ZipFile | None, source: str, member: str | None) -> bytes:
+    if member is None:
+        with open(source, "rb") as f:
+            return f.read()
+    return archive.read(member)
+
+
+def _parse_one(pool: ParserPool, archive: zipfile.ZipFile | None, doc_id: str, source: str,
+               member: str | None, full_text: bool) -> dict:
+    """Read one document, parse it in a pool worker and time it."""
+    start = time.perf_counter()
+    try:
+        content = _read_document(archive, source, member)
+        parsed = pool.parse(content)
+        if not full_text:
+            parsed.pop("full_text", None)
+        record = {"id": doc_id, "sha256": content_hash(content), "ok": True, "parsed": parsed}
+    except Exception as e:
+        record = {"id": doc_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def discover(source: str) -> list[tuple[str, str, str | None]]:
+    """List (doc_id, source, zip_member) for every PDF in a directory or zip."""
+    if os.path.isdir(source):
+        docs = []
+        for root, _, files in os.walk(source):
+            for name in files:
+                if name.lower().endswith(".pdf"):
+                    path = os.path.join(root, name)
+                    docs.append((os.path.relpath(path, source), path, None))
+        return sorted(docs)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            return sorted(
+                (info.filename, source, info.filename)
+                for info in zf.infolist()
+                if not info.is_dir() and info.filename.lower().endswith(".pdf")
+            )
+    raise ValueError(f"{source} is neither a directory nor a zip archive")
+
+
+def load_done(output: str, retry_errors: bool) -> set[str]:
+    """IDs already present in an existing output file."""
+    done: set[str] = set()
+    if not os.path.exists(output):
+        return done
+    with open(output, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # partial line from an interrupted write
+            if record.get("ok") or not retry_errors:
+                done.add(record["id"])
+    return done
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+
+def ingest(
+    source: str,
+    output: str,
+    workers: int | None = None,
+    full_text: bool = True,
+    retry_errors: bool = False,
+    timeout: float = PARSER_TIMEOUT,
+    memory_mb: int = PARSER_MEMORY_MB,
+) -> dict:
+    docs = discover(source)
+    done = load_done(output, retry_errors)
+    todo = [d for d in docs if d[0] not in done]
+    workers = workers or os.cpu_count() or 1
+    print(f"Found {len(docs)} PDFs, {len(docs) - len(todo)} already done, {len(todo)} to parse "
+          f"with {workers} workers.")
+
+    timings: list[float] = []
+    errors = 0
+    start = time.perf_counter()
+    pending = set()
+    queue = iter(todo)
+    # Bound in-flight work so memory doesn't grow with archive size
+    max_in_flight = workers * 2
+
+    # One thread per parser process: each blocks on its own document, and
+    # the pool kills and replaces a worker that runs over its limits
+    parsers = ParserPool(size=workers, timeout=timeout, memory_mb=memory_mb)
+    # The archive (opened once, shared by the reader threads) closes after
+    # the thread pool has drained
+    with (nullcontext() if os.path.isdir(source) else zipfile.ZipFile(source)) as archive, \
+            open(output, "a", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            while True:
+                while len(pending) < max_in_flight:
+                    doc = next(queue, None)
+                    if doc is None:
+                        break
+                    pending.add(pool.submit(_parse_one, parsers, archive, *doc, full_text))
+                if not pending:
+                    break
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    record = future.result()
+                    out.write(json.dumps(record) + "\n")
+                    timings.append(record["seconds"])
+                    if not record["ok"]:
+                        errors += 1
+                out.flush()
+                if len(timings) % 100 < len(finished):
+                    rate = len(timings) / (time.perf_counter() - start)
+                    print(f"  {len(timings)}/{len(todo)} docs ({rate:.1f} docs/sec)")
+        except KeyboardInterrupt:
+            print("Interrupted; finished results are saved, re-run to resume.")
+            for future in pending:
+                future.cancel()
+        finally:
+            parsers.shutdown()
+
+    elapsed = time.perf_counter() - start
+    report = {
+        "docs": len(timings),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 2),
+        "docs_per_sec": round(len(timings) / elapsed, 2) if elapsed > 0 else 0.0,
+        "p50_s": round(_percentile(timings, 0.50), 4),
+        "p95_s": round(_percentile(timings, 0.95), 4),
+    }
+    print("--- Ingestion report ---")
+    print(f"Parsed:      {report['docs']} docs ({report['errors']} errors) in {report['elapsed_s']}s")
+    print(f"Throughput:  {report['docs_per_sec']} docs/sec")
+    print(f"Per doc:     p50 {report['p50_s'] * 1000:.1f} ms, p95 {report['p95_s'] * 1000:.1f} ms")
+    return report
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Parse a directory or zip of resume PDFs into JSONL.")
+    ap.add_argument("source", help="directory or .zip containing PDFs")
+    ap.add_argument("-o", "--output", required=True, help="JSONL file to append results to")
+    ap.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    ap.add_argument("--no-full-text", action="store_true", help="omit full_text from records")
+    ap.add_argument("--retry-errors", action="store_true", help="re-parse documents that failed before")
+    ap.add_argument("--timeout", type=float, default=PARSER_TIMEOUT, help="seconds allowed per document")
+    ap.add_argument("--memory-mb", type=int, default=PARSER_MEMORY_MB,
+                    help="memory allowed per document above a worker's baseline (0: unlimited)")
+    args = ap.parse_args(argv)
+    ingest(args.source, args.output, args.workers, not args.no_full_text, args.retry_errors,
+           args.timeout, args.memory_mb)
+
+
+if __name__ == "__main__":
+    main()
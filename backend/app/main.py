@@ -2,19 +2,36 @@ from fastapi import FastAPI, UploadFile, File, Body, Depends, HTTPException, Hea
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from datetime import timedelta, datetime
 from typing import Optional
 import json
+import threading
 
 import io
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import simpleSplit
 
-from .parser import parse_resume, extract_skills
-from .skills import SKILLS, SYNONYMS, ROLE_KEYWORDS
+from .parser import parse_cache
+from .embeddings import (
+    get_sbert_model, get_similarity, encode_texts, embedding_cache, encode_batcher,
+    warm_embedding_cache, SBERT_BACKEND,
+)
+from .vector_index import get_vector_index, flush_vector_indexes
+from .analysis_embeddings import embed_analysis, load_embeddings
+from .scoring import compute_score, compute_scores, SCORING_VERSION
+from .executor import scoring_executor, ExecutorBusy, SCORING_RETRY_AFTER
+from .ranking import get_resume_pool
+from .fuzzy_skills import add_fuzzy_skills, FUZZY_SKILLS
+from .taxonomy import get_taxonomy, reload_taxonomy, start_taxonomy_watcher, TAXONOMY_PATH
+from .uploads import (
+    UploadLimitMiddleware, hash_upload, save_upload,
+    MAX_RESUME_BYTES, MAX_AVATAR_BYTES,
+)
+from .workers import get_parser_pool, ParseTimeout, ParseMemoryError, ParserPoolBusy
 from .database import get_db, init_db
 from .models import User, Analysis
 from .auth import (
@@ -24,7 +41,6 @@ from .auth import (
 
 from dotenv import load_dotenv
 import os
-from sentence_transformers import SentenceTransformer, util
 from groq import Groq
 
 # Load environment variables
@@ -46,41 +62,6 @@ def get_groq_client():
             return None
     return _groq_client
 
-# SBERT Model Loading
-_sbert_model = None
-
-def get_sbert_model():
-    global _sbert_model
-    if _sbert_model is None:
-        try:
-            print("Loading SBERT model (all-MiniLM-L6-v2)...")
-            _sbert_model = SentenceTransformer('all-MiniLM-L6-v2')
-            print("SBERT model loaded!")
-        except Exception as e:
-            print(f"Failed to load SBERT model: {e}")
-            return None
-    return _sbert_model
-
-def get_similarity(text1, text2):
-    """Semantic similarity using Sentence-Transformers (Deep Learning)"""
-    try:
-        model = get_sbert_model()
-        if not model:
-            print("SBERT model not available, returning 0.0")
-            return 0.0
-        
-        # Compute embeddings
-        # convert_to_tensor=True allows utilizing GPU if available, or optimized CPU tensor ops
-        embeddings1 = model.encode(text1, convert_to_tensor=True)
-        embeddings2 = model.encode(text2, convert_to_tensor=True)
-        
-        # Compute cosine similarity
-        score = util.cos_sim(embeddings1, embeddings2)
-        return float(score.item())
-    except Exception as e:
-        print(f"Similarity error: {e}")
-        return 0.0
-
 app = FastAPI(title="Resume SaaS Backend")
 os.makedirs("avatars", exist_ok=True)
 app.mount("/avatars", StaticFiles(directory="avatars"), name="avatars")
@@ -91,6 +72,28 @@ async def startup_event():
     print("🔧 Initializing database...")
     init_db()
     print("✅ Database initialized!")
+    start_taxonomy_watcher()
+    if SBERT_BACKEND == "onnx":
+        # Fail startup on a missing or broken export rather than serve zero similarity
+        get_sbert_model()
+    if embedding_cache.disk_dir:
+        # Loads SBERT and indexes the stored vectors without delaying startup
+        threading.Thread(target=warm_embedding_cache, daemon=True).start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    get_parser_pool().shutdown()
+    scoring_executor.shutdown()
+    flush_vector_indexes()
+
+# Reject oversized uploads before the multipart parser spools them. Added
+# before CORSMiddleware so CORS wraps it (the last one added runs outermost)
+# and a 413 reaches the browser with its CORS headers.
+app.add_middleware(
+    UploadLimitMiddleware,
+    limits={"/upload-resume": MAX_RESUME_BYTES, "/auth/upload-avatar": MAX_AVATAR_BYTES},
+)
 
 # Configure CORS - Nuclear option for production
 # Set allow_credentials=False when using "*" to avoid browser blocks
@@ -120,29 +123,17 @@ class TokenResponse(BaseModel):
 # ---- HELPER FUNCTIONS ----
 
 # Helper function _extract_skills_from_text removed; imported from .parser
+# compute_score and role detection live in .scoring
 
 
-def _detect_role(jd_text: str) -> str:
-    jd_low = jd_text.lower()
-    jd_len = len(jd_low)
-    
-    # If JD is too short, don't guess a specific role
-    if jd_len < 40:
-        return "Generic / Undefined Role"
-        
-    best_role = "General Software Engineer"
-    best_hits = 0
-    for role, keywords in ROLE_KEYWORDS.items():
-        hits = sum(1 for kw in keywords if kw.lower() in jd_low)
-        if hits > best_hits:
-            best_hits = hits
-            best_role = role
-            
-    # If no specific keywords matched despite reasonable length, call it general
-    if best_hits == 0:
-        return "Software Professional" if jd_len < 300 else "General Software Engineer"
-        
-    return best_role
+async def _run_scoring(fn, *args):
+    """Run CPU-bound scoring off the event loop; 503 + Retry-After when saturated."""
+    try:
+        return await scoring_executor.run(fn, *args)
+    except ExecutorBusy as e:
+        raise HTTPException(status_code=503, detail=str(e),
+                            headers={"Retry-After": str(SCORING_RETRY_AFTER)})
+
 
 # ---- AUTH ENDPOINTS ----
 # ---- AUTH ENDPOINTS ----
@@ -308,8 +299,7 @@ async def upload_avatar(
     filename = f"user_{user.id}_{file.filename}"
     filepath = os.path.join(folder, filename)
 
-    with open(filepath, "wb") as f:
-        f.write(await file.read())
+    await save_upload(file, filepath, MAX_AVATAR_BYTES)
 
     # Use BACKEND_URL from env if set (for production), otherwise use relative path (for dev with proxy)
     backend_url = os.getenv("BACKEND_URL")
@@ -334,123 +324,157 @@ def home():
     return {"status": "Backend running", "message": "Resume SaaS API is live 🚀"}
 
 
+@app.get("/stats/cache")
+def cache_stats():
+    """Hit/miss counters for the server-side caches"""
+    return {"parse": parse_cache.stats(), "embeddings": embedding_cache.stats()}
+
+
+@app.get("/stats/scoring")
+def scoring_stats():
+    """Scoring executor: running, queued and rejected requests"""
+    return scoring_executor.stats()
+
+
+@app.get("/stats/inference")
+def inference_stats():
+    """SBERT micro-batching: batch-size and queue-wait histograms"""
+    return encode_batcher.stats()
+
+
+@app.get("/taxonomy")
+def taxonomy_info():
+    """Version and size of the skill taxonomy currently in use"""
+    taxonomy = get_taxonomy()
+    return {
+        "version": taxonomy.version,
+        "source": TAXONOMY_PATH or "built-in",
+        "skills": len(taxonomy.skills),
+        "terms": len(taxonomy.aliases),
+        "roles": len(taxonomy.role_keywords),
+        "conflicts": taxonomy.conflicts,
+    }
+
+
+@app.post("/admin/taxonomy/reload")
+async def taxonomy_reload(x_admin_token: Optional[str] = Header(None)):
+    """Recompile TAXONOMY_PATH in the background and swap it in (requires ADMIN_TOKEN)"""
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if not admin_token or x_admin_token != admin_token:
+        raise HTTPException(status_code=403, detail="Admin token required")
+    if not TAXONOMY_PATH:
+        raise HTTPException(status_code=400, detail="TAXONOMY_PATH is not configured")
+    try:
+        taxonomy = await run_in_threadpool(reload_taxonomy)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Taxonomy reload failed: {str(e)}")
+    return {"version": taxonomy.version, "conflicts": taxonomy.conflicts}
+
+
 @app.post("/upload-resume")
 async def upload_resume(file: UploadFile = File(...)):
     """Upload and parse a PDF resume"""
     try:
-        content = await file.read()
-        parsed = parse_resume(content)
+        # Hash while streaming so a re-upload is served from cache before
+        # the document bytes are even materialised.
+        digest, _ = await hash_upload(file, MAX_RESUME_BYTES)
+        parsed = parse_cache.get(digest)
+        if parsed is None:
+            content = await file.read()
+            # Parsing is CPU-bound: run it in the worker pool so a slow or hostile
+            # PDF can't block the event loop, and is killed if it runs too long.
+            parsed = await run_in_threadpool(get_parser_pool().parse, content)
+            # Optional embedding-based skill normalization; runs here because
+            # the SBERT model lives in this process, not in the parser workers,
+            # and on the scoring executor so its encodes share the 503 bound.
+            if FUZZY_SKILLS:
+                parsed = await _run_scoring(add_fuzzy_skills, parsed)
+            # Don't file a result under a taxonomy that was swapped mid-parse
+            if parsed.get("taxonomy_version") == get_taxonomy().version:
+                parse_cache.put(digest, parsed)
         return {"filename": file.filename, "parsed": parsed}
+    except HTTPException:
+        raise
+    except ParseTimeout as e:
+        raise HTTPException(status_code=422, detail=f"Resume is too complex to parse: {str(e)}")
+    except ParseMemoryError as e:
+        raise HTTPException(status_code=422, detail=f"Resume is too large to parse: {str(e)}")
+    except ParserPoolBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse resume: {str(e)}")
 
 
-def compute_score(resume_text: str, jd_text: str, resume_skills_input: list[str] | None = None) -> dict:
-    """Compute match score between resume and JD"""
-    resume_text = (resume_text or "").lower()
-    jd_text = (jd_text or "").lower()
-    resume_skills_input = resume_skills_input or []
-
-    if not resume_text or not jd_text:
-        return {"error": "Resume or JD missing"}
+@app.post("/score")
+async def score_resume(data: dict = Body(...)):
+    """Score resume against job description"""
+    return await _run_scoring(
+        compute_score, data.get("resume") or "", data.get("jd") or "", data.get("skills") or []
+    )
 
-    resume_skills: set[str] = set(s.lower() for s in resume_skills_input)
-    if not resume_skills:
-        resume_skills = set(extract_skills(resume_text))
 
-    jd_skills = set(extract_skills(jd_text))
+SCORE_BATCH_MAX_JDS = int(os.getenv("SCORE_BATCH_MAX_JDS", 500))
 
-    matched_jd_skills = sorted(s for s in jd_skills if s in resume_skills)
-    missing_skills = sorted(s for s in jd_skills if s not in resume_skills)
-    resume_extra_skills = sorted(s for s in resume_skills if s not in jd_skills)
 
-    # SCORING LOGIC
-    # 1. Skill Match (Primary Factor)
-    if jd_skills:
-        coverage = len(matched_jd_skills) / len(jd_skills)
-    else:
-        coverage = 0.0
+@app.post("/score/batch")
+async def score_resume_batch(data: dict = Body(...)):
+    """
+    Score one resume against many job descriptions.
 
-    skill_score = coverage * 75.0  # Max 75 points from skills
+    Body: {"resume": str, "skills": [str], "jds": [str | {"id": any, "jd": str}]}
+    The resume is processed once and all JDs are embedded in one batch.
+    Results come back in request order; entries given as objects keep their id.
+    """
+    jds = data.get("jds")
+    if not isinstance(jds, list):
+        raise HTTPException(status_code=400, detail="'jds' must be a list")
+    if len(jds) > SCORE_BATCH_MAX_JDS:
+        raise HTTPException(status_code=400, detail=f"At most {SCORE_BATCH_MAX_JDS} JDs per batch")
 
-    # 2. Semantic Similarity (Secondary Factor)
-    try:
-        similarity = get_similarity(resume_text, jd_text)
-        # Clamp between 0 and 1
-        similarity = max(0.0, min(1.0, similarity))
-    except Exception:
-        similarity = 0.0
-
-    # 3. JD Depth Penalty (Prevents inflated scores for low-effort or single-word JDs)
-    jd_len = len(jd_text)
-    jd_skill_count = len(jd_skills)
-    
-    # Length Multiplier
-    if jd_len < 50: len_mult = 0.2
-    elif jd_len < 200: len_mult = 0.5
-    elif jd_len < 600: len_mult = 0.85
-    else: len_mult = 1.0
-    
-    # Skill Density Multiplier
-    if jd_skill_count == 0: skill_mult = 0.0
-    elif jd_skill_count == 1: skill_mult = 0.35
-    elif jd_skill_count == 2: skill_mult = 0.65
-    elif jd_skill_count <= 4: skill_mult = 0.9
-    else: skill_mult = 1.0
-    
-    # Final quality multiplier (weighted average)
-    quality_multiplier = (len_mult * 0.4) + (skill_mult * 0.6)
-
-    # 4. Final Adjustment Logic
-    # If JD is extremely short and has no detected skills, return 0
-    if jd_len < 10 and not jd_skills:
-        return {
-            "final_score": 0.0,
-            "skill_score": 0.0,
-            "jd_similarity_score": 0.0,
-            "similarity_raw": 0.0,
-            "matched_jd_skills": [],
-            "missing_skills": [],
-            "resume_extra_skills": [],
-            "role": "Unknown",
-        }
-
-    # If JD has no skills, rely more on semantic but penalize valid "tech" comparison
-    if not jd_skills:
-        if similarity < 0.5:
-            jd_score = 0.0
+    ids, jd_texts = [], []
+    for item in jds:
+        if isinstance(item, dict):
+            ids.append(item.get("id"))
+            jd_texts.append(item.get("jd") or "")
         else:
-            jd_score = similarity * 50.0 
-    else:
-        jd_score = similarity * 25.0
+            ids.append(None)
+            jd_texts.append(item if isinstance(item, str) else "")
 
-    # Apply the JD Depth Penalty to both scores
-    skill_score = skill_score * quality_multiplier
-    jd_score = jd_score * len_mult
+    results = await _run_scoring(
+        compute_scores, data.get("resume") or "", jd_texts, data.get("skills") or []
+    )
+    for jd_id, result in zip(ids, results):
+        if jd_id is not None:
+            result["id"] = jd_id
+    return {"count": len(results), "results": results}
 
-    final_score = round(skill_score + jd_score, 2)
-    
-    # Cap at 100
-    final_score = min(100.0, final_score)
 
-    detected_role = _detect_role(jd_text)
+RANK_MAX_K = int(os.getenv("RANK_MAX_K", 100))
 
-    return {
-        "final_score": float(final_score),
-        "skill_score": float(round(skill_score, 2)),
-        "jd_similarity_score": float(round(jd_score, 2)),
-        "similarity_raw": float(round(similarity, 4)),
-        "matched_jd_skills": matched_jd_skills,
-        "missing_skills": missing_skills,
-        "resume_extra_skills": resume_extra_skills,
-        "role": detected_role,
-    }
 
+@app.post("/rank")
+async def rank_resumes(data: dict = Body(...)):
+    """
+    Rank the stored resume pool (RESUME_POOL_DIR) against one JD.
 
-@app.post("/score")
-async def score_resume(data: dict = Body(...)):
-    """Score resume against job description"""
-    return compute_score(data.get("resume") or "", data.get("jd") or "", data.get("skills") or [])
+    Body: {"jd": str, "k": int}. Returns the top-k resumes, best first, each
+    with the same breakdown as /score plus the resume id.
+    """
+    jd_text = data.get("jd") or ""
+    if not jd_text.strip():
+        raise HTTPException(status_code=400, detail="JD missing")
+    try:
+        k = int(data.get("k") or 10)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="'k' must be an integer")
+    if not 1 <= k <= RANK_MAX_K:
+        raise HTTPException(status_code=400, detail=f"'k' must be between 1 and {RANK_MAX_K}")
+
+    pool = await run_in_threadpool(get_resume_pool)
+    if pool is None:
+        raise HTTPException(status_code=503, detail="Resume pool not configured (set RESUME_POOL_DIR)")
+    results = await _run_scoring(pool.rank, jd_text, k)
+    return {"pool_size": len(pool), "count": len(results), "results": results}
 
 
 import uuid
@@ -655,9 +679,13 @@ def _generate_fallback_pdf(result, error_msg=""):
 async def score_report(data: dict = Body(...)):
     """Legacy endpoint (kept for safety, but we move to two-step)"""
     try:
-        result = compute_score(data.get("resume") or "", data.get("jd") or "", data.get("skills") or [])
-        buffer = _generate_pdf_buffer(result)
+        result = await _run_scoring(
+            compute_score, data.get("resume") or "", data.get("jd") or "", data.get("skills") or []
+        )
+        buffer = await _run_scoring(_generate_pdf_buffer, result)
         return StreamingResponse(buffer, media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=resume_match_report.pdf"})
+    except HTTPException:
+        raise
     except Exception as e:
         return JSONResponse(status_code=500, content={"detail": str(e)})
 
@@ -665,7 +693,9 @@ async def score_report(data: dict = Body(...)):
 async def init_score_download(data: dict = Body(...)):
     """Step 1: Generate PDF and return ID"""
     try:
-        result = compute_score(data.get("resume") or "", data.get("jd") or "", data.get("skills") or [])
+        result = await _run_scoring(
+            compute_score, data.get("resume") or "", data.get("jd") or "", data.get("skills") or []
+        )
         
         # Enrich result with extra data for the professional PDF
         result["user_name"] = data.get("user_name") or "Guest"
@@ -673,19 +703,24 @@ async def init_score_download(data: dict = Body(...)):
         result["skills_to_add"] = data.get("skills_to_add")
         result["bullet_suggestions"] = data.get("bullet_suggestions")
 
-        try:
-            buffer = _generate_pdf_buffer(result)
-        except Exception as e:
-            # Fallback
-            import traceback
-            traceback.print_exc()
-            buffer = _generate_fallback_pdf(result, str(e))
+        def build_pdf():
+            try:
+                return _generate_pdf_buffer(result)
+            except Exception as e:
+                # Fallback
+                import traceback
+                traceback.print_exc()
+                return _generate_fallback_pdf(result, str(e))
+
+        buffer = await _run_scoring(build_pdf)
         
         report_id = str(uuid.uuid4())
         REPORT_CACHE[report_id] = buffer
         # Return URL ending in .pdf so browser sees it as file
         return {"download_url": f"/download-report/{report_id}/resume_match_report.pdf"}
         
+    except HTTPException:
+        raise
     except Exception as e:
         return JSONResponse(status_code=500, content={"detail": str(e)})
 
@@ -774,6 +809,16 @@ JD:
 
 # ---- PROTECTED ENDPOINTS ----
 
+def _score_and_embed(resume_text: str, jd_text: str) -> tuple[dict, dict]:
+    """compute_score plus the row's embedding columns, in one scoring-executor slot."""
+    scores = compute_score(resume_text, jd_text)
+    if "error" in scores:
+        return scores, {}
+    # Scoring just embedded both texts, so these are usually cache hits; on
+    # a miss the encode still counts against the executor's bound
+    return scores, embed_analysis(resume_text, jd_text)
+
+
 @app.post("/analyze")
 async def analyze_resume(
     data: dict = Body(...),
@@ -792,7 +837,7 @@ async def analyze_resume(
     
     resume_text = data.get("resume", "")
     jd_text = data.get("jd", "")
-    scores = compute_score(resume_text, jd_text)
+    scores, embedding_columns = await _run_scoring(_score_and_embed, resume_text, jd_text)
     
     if "error" in scores:
         raise HTTPException(status_code=400, detail=scores["error"])
@@ -806,14 +851,100 @@ async def analyze_resume(
         skill_score=scores["skill_score"],
         semantic_score=scores["jd_similarity_score"],
         missing_skills=json.dumps(scores.get("missing_skills", [])),
-        bonus_skills=json.dumps(scores.get("resume_extra_skills", []))
+        bonus_skills=json.dumps(scores.get("resume_extra_skills", [])),
+        similarity_raw=scores["similarity_raw"],
+        resume_skills=json.dumps(sorted(scores["matched_jd_skills"] + scores["resume_extra_skills"])),
+        jd_skills=json.dumps(sorted(scores["matched_jd_skills"] + scores["missing_skills"])),
+        taxonomy_version=scores["taxonomy_version"],
+        scoring_version=SCORING_VERSION,
+        **embedding_columns
     )
     db.add(analysis)
     db.commit()
+    # Make the analysis searchable by its resume and JD
+    await run_in_threadpool(_index_analysis, db, analysis.id)
     
     return scores
 
 
+# Vector indexes of saved analyses, by what was embedded
+ANALYSIS_INDEXES = {"resume": "analysis_resumes", "jd": "analysis_jds"}
+
+
+def _index_analysis(db: Session, analysis_id: int) -> None:
+    try:
+        for kind, index_name in ANALYSIS_INDEXES.items():
+            ids, vectors = load_embeddings(db, f"{kind}_embedding", ids=[analysis_id])
+            if not len(ids):
+                continue
+            index = get_vector_index(index_name, vectors.shape[1])
+            if index is not None:
+                index.add([str(i) for i in ids], vectors)
+    except Exception as e:
+        print(f"Indexing analysis {analysis_id} failed: {e}")
+
+
+def _search_analyses(kind: str, query: str, k: int, analysis_ids: list[int]) -> list[tuple[int, float]]:
+    vectors = encode_texts([query.lower()])
+    if vectors is None:
+        return []
+    index = get_vector_index(ANALYSIS_INDEXES[kind], vectors.shape[1])
+    if index is None:
+        return []
+    return [(int(vid), score) for vid, score in index.search(vectors[0], k, ids=analysis_ids)]
+
+
+@app.post("/analyses/search")
+async def search_analyses(
+    data: dict = Body(...),
+    authorization: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Find the current user's analyses whose JD (kind="jd") or resume
+    (kind="resume") is semantically closest to a query text.
+
+    Body: {"query": str, "kind": "jd" | "resume", "k": int}
+    """
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Missing token")
+    
+    token = authorization.replace("Bearer ", "")
+    try:
+        current_user = get_current_user(token, db)
+    except:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    query = data.get("query") or ""
+    kind = data.get("kind") or "jd"
+    if not query.strip():
+        raise HTTPException(status_code=400, detail="Query missing")
+    if kind not in ANALYSIS_INDEXES:
+        raise HTTPException(status_code=400, detail="'kind' must be 'jd' or 'resume'")
+    try:
+        k = min(max(int(data.get("k") or 10), 1), 100)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="'k' must be an integer")
+
+    # The index spans all users, so the search is limited to this user's rows
+    own_ids = [aid for (aid,) in db.query(Analysis.id).filter(Analysis.user_id == current_user.id)]
+    if not own_ids:
+        return []
+    hits = await _run_scoring(_search_analyses, kind, query, k, own_ids)
+    if not hits:
+        return []
+    rows = db.query(Analysis).filter(
+        Analysis.id.in_([aid for aid, _ in hits]),
+        Analysis.user_id == current_user.id
+    ).all()
+    by_id = {a.id: a for a in rows}
+    return [
+        {"id": aid, "similarity": round(score, 4), "resume_name": by_id[aid].resume_name,
+         "job_title": by_id[aid].job_title, "match_score": by_id[aid].match_score}
+        for aid, score in hits if aid in by_id
+    ]
+
+
 @app.get("/analyses")
 def get_user_analyses(
     authorization: Optional[str] = Header(None),
@@ -0,0 +1,114 @@
+# backend/app/matcher.py
+
+import re
+from typing import Iterable
+
+# Regex character-class bodies for the characters that may surround a phrase.
+# Skills keep the boundary rules the parser has always used: start/end of
+# text, whitespace, or , . / ; : ( ) [ ]
+SKILL_BOUNDARY = r"\s,./;:()\[\]"
+# Plain word boundaries (any non-word character), e.g. for role keywords
+WORD_BOUNDARY = r"\W"
+
+
+def _trie_pattern(node: dict) -> str | None:
+    """Render a character trie as a regex that tries longer phrases first."""
+    if "" in node and len(node) == 1:
+        return None
+
+    alternatives = []
+    single_chars = []
+    for ch in sorted(k for k in node if k):
+        sub = _trie_pattern(node[ch])
+        if sub is None:
+            single_chars.append(re.escape(ch))
+        else:
+            alternatives.append(re.escape(ch) + sub)
+
+    only_chars = not alternatives
+    if single_chars:
+        if len(single_chars) == 1:
+            alternatives.append(single_chars[0])
+        else:
+            alternatives.append("[" + "".join(single_chars) + "]")
+
+    if len(alternatives) == 1:
+        pattern = alternatives[0]
+    else:
+        pattern = "(?:" + "|".join(alternatives) + ")"
+
+    if "" in node:
+        # Phrase may stop here; the greedy "?" still tries the longer one first
+        if only_chars and len(single_chars) == 1:
+            pattern += "?"
+        else:
+            pattern = "(?:" + pattern + ")?"
+    return pattern
+
+
+class PhraseMatcher:
+    """
+    Finds every phrase of a fixed vocabulary in a single scan of the text.
+
+    The vocabulary is compiled once into a trie-shaped regex, so the cost of a
+    scan grows with the length of the text rather than the number of phrases.
+    Each phrase maps to one or more values (e.g. a synonym to its canonical
+    skill). Phrases only match between boundary characters, and a phrase that
+    is a prefix of a longer match (``react`` inside ``react native``) is
+    reported as well, exactly as independent per-phrase searches would.
+    """
+
+    def __init__(self, phrases: dict[str, Iterable[str]], boundary: str = SKILL_BOUNDARY):
+        self.values: dict[str, frozenset[str]] = {
+            p: frozenset(v) for p, v in phrases.items() if p
+        }
+
+        trie: dict = {}
+        for phrase in self.values:
+            node = trie
+            for ch in phrase:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        # A longest match at a position implies every shorter phrase that ends
+        # on a delimiter inside it; precompute those so one hit is enough.
+        is_boundary = re.compile(f"[{boundary}]").match
+        self._implied: dict[str, frozenset[str]] = {}
+        self._expanded: dict[str, frozenset[str]] = {}
+        for phrase, values in self.values.items():
+            implied = {phrase}
+            for i, ch in enumerate(phrase):
+                if i and is_boundary(ch) and phrase[:i] in self.values:
+                    implied.add(phrase[:i])
+            self._implied[phrase] = frozenset(implied)
+            self._expanded[phrase] = frozenset().union(*(self.values[p] for p in implied))
+
+        body = _trie_pattern(trie) if trie else None
+        if body is None:
+            self._regex = None
+        else:
+            self._regex = re.compile(
+                rf"(?<![^{boundary}])(?=({body})(?![^{boundary}]))"
+            )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def matched_phrases(self, text: str) -> set[str]:
+        """Return the distinct vocabulary phrases present in ``text``."""
+        if self._regex is None or not text:
+            return set()
+        longest = {m.group(1) for m in self._regex.finditer(text)}
+        found: set[str] = set()
+        for phrase in longest:
+            found |= self._implied[phrase]
+        return found
+
+    def find(self, text: str) -> set[str]:
+        """Return the values of every phrase present in ``text``."""
+        if self._regex is None or not text:
+            return set()
+        found: set[str] = set()
+        for phrase in {m.group(1) for m in self._regex.finditer(text)}:
+            found |= self._expanded[phrase]
+        return found
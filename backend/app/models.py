@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, ForeignKey, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -47,4 +47,18 @@ class Analysis(Base):
     bonus_skills = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # SBERT embeddings as float16 blobs (see analysis_embeddings.py), and
+    # the model that produced them
+    resume_embedding = Column(LargeBinary, nullable=True)
+    jd_embedding = Column(LargeBinary, nullable=True)
+    embedding_model = Column(String, nullable=True)
+
+    # Scoring inputs, so scores can be recomputed without SBERT when the
+    # formula (scoring_version) or taxonomy (taxonomy_version) changes
+    similarity_raw = Column(Float, nullable=True)
+    resume_skills = Column(Text, nullable=True)
+    jd_skills = Column(Text, nullable=True)
+    taxonomy_version = Column(String, nullable=True)
+    scoring_version = Column(String, nullable=True)
+
     owner = relationship("User", back_populates="analyses")
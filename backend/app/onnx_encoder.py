@@ -0,0 +1,172 @@
+# backend/app/onnx_encoder.py
+"""
+ONNX Runtime backend for the SBERT encoder (SBERT_BACKEND=onnx).
+
+Runs an ONNX export of the sentence-transformers model with the same mean
+pooling + L2 normalization, without importing torch at serve time. The
+export can be int8 dynamically quantized for faster CPU inference.
+
+Export once (needs torch + onnx; add onnxruntime for --quantize):
+    python -m app.onnx_encoder export -o onnx_model/ [--quantize]
+
+Then serve with SBERT_BACKEND=onnx SBERT_ONNX_DIR=onnx_model/ (and
+SBERT_ONNX_QUANTIZED=1 to use the int8 model from --quantize).
+Requires: pip install onnxruntime tokenizers
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model.int8.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+CONFIG_FILE = "encoder.json"
+
+
+class _Tokenizer:
+    """The slice of the transformers tokenizer API that chunk_text uses."""
+
+    def __init__(self, tokenizer):
+        self._tokenizer = tokenizer
+
+    def __call__(self, text: str, add_special_tokens: bool = True, return_offsets_mapping: bool = False) -> dict:
+        encoding = self._tokenizer.encode(text, add_special_tokens=add_special_tokens)
+        out = {"input_ids": encoding.ids}
+        if return_offsets_mapping:
+            out["offset_mapping"] = encoding.offsets
+        return out
+
+
+class OnnxSentenceEncoder:
+    """
+    Drop-in for the parts of SentenceTransformer the app uses: encode(),
+    tokenizer, max_seq_length and get_sentence_embedding_dimension().
+    """
+
+    def __init__(self, model_dir: str, quantized: bool = False, threads: int = 0):
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError:
+            raise RuntimeError("onnxruntime and tokenizers are required for SBERT_BACKEND=onnx "
+                               "(pip install onnxruntime tokenizers)")
+
+        with open(os.path.join(model_dir, CONFIG_FILE), "r", encoding="utf-8") as f:
+            config = json.load(f)
+        self.max_seq_length: int = config["max_seq_length"]
+        self._dims: int = config["dims"]
+
+        tokenizer = Tokenizer.from_file(os.path.join(model_dir, TOKENIZER_FILE))
+        tokenizer.no_padding()
+        tokenizer.no_truncation()
+        self._raw_tokenizer = tokenizer
+        self.tokenizer = _Tokenizer(tokenizer)
+
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        path = os.path.join(model_dir, QUANTIZED_MODEL_FILE if quantized else MODEL_FILE)
+        if not os.path.exists(path):
+            hint = " (export with --quantize, or set SBERT_ONNX_QUANTIZED=0)" if quantized else ""
+            raise FileNotFoundError(f"ONNX model not found: {path}{hint}")
+        self._session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self._inputs = {i.name for i in self._session.get_inputs()}
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self._dims
+
+    def _batch(self, texts: list[str]) -> dict[str, np.ndarray]:
+        encodings = self._raw_tokenizer.encode_batch(texts)
+        length = min(self.max_seq_length, max(len(e.ids) for e in encodings))
+        ids = np.zeros((len(texts), length), dtype=np.int64)
+        mask = np.zeros((len(texts), length), dtype=np.int64)
+        for row, e in enumerate(encodings):
+            n = min(len(e.ids), length)
+            ids[row, :n] = e.ids[:n]
+            mask[row, :n] = 1
+            if len(e.ids) > length:
+                # Keep the closing [SEP] like the transformers tokenizer does
+                ids[row, n - 1] = e.ids[-1]
+        feed = {"input_ids": ids, "attention_mask": mask}
+        if "token_type_ids" in self._inputs:
+            feed["token_type_ids"] = np.zeros_like(ids)
+        return feed
+
+    def encode(self, sentences, batch_size: int = 32, convert_to_numpy: bool = True,
+               normalize_embeddings: bool = False, **_) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        out = np.zeros((len(texts), self._dims), dtype=np.float32)
+        # Sort by length so each batch pads to similar lengths
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        for start in range(0, len(order), batch_size):
+            rows = order[start:start + batch_size]
+            feed = self._batch([texts[i] for i in rows])
+            tokens = self._session.run(None, feed)[0]
+            # Mean pooling over real tokens
+            mask = feed["attention_mask"][:, :, None].astype(np.float32)
+            pooled = (tokens * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if normalize_embeddings:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            out[rows] = pooled
+        return out[0] if single else out
+
+
+def export(model_name: str, output_dir: str, quantize: bool = False, opset: int = 14) -> None:
+    """Export a sentence-transformers model's transformer to ONNX (+ int8 copy)."""
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(output_dir, exist_ok=True)
+    st = SentenceTransformer(model_name, device="cpu")
+    transformer = st[0].auto_model.eval()
+    tokenizer = st.tokenizer
+    tokenizer.backend_tokenizer.save(os.path.join(output_dir, TOKENIZER_FILE))
+
+    sample = tokenizer(["an example sentence"], return_tensors="pt")
+    names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in sample]
+    dynamic = {n: {0: "batch", 1: "tokens"} for n in names}
+    dynamic["token_embeddings"] = {0: "batch", 1: "tokens"}
+    path = os.path.join(output_dir, MODEL_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(sample[n] for n in names),
+            path,
+            input_names=names,
+            output_names=["token_embeddings"],
+            dynamic_axes=dynamic,
+            opset_version=opset,
+        )
+
+    with open(os.path.join(output_dir, CONFIG_FILE), "w", encoding="utf-8") as f:
+        json.dump({
+            "model": model_name,
+            "max_seq_length": st.max_seq_length,
+            "dims": st.get_sentence_embedding_dimension(),
+        }, f)
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(path, os.path.join(output_dir, QUANTIZED_MODEL_FILE), weight_type=QuantType.QInt8)
+    print(f"Exported {model_name} to {output_dir}" + (" (+ int8)" if quantize else ""))
+
+
+def main(argv=None):
+    from .embeddings import SBERT_MODEL_NAME
+
+    ap = argparse.ArgumentParser(description="Export the SBERT encoder to ONNX.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export")
+    exp.add_argument("-o", "--output", required=True, help="output directory")
+    exp.add_argument("--model", default=SBERT_MODEL_NAME)
+    exp.add_argument("--quantize", action="store_true", help="also write an int8 dynamically quantized model")
+    args = ap.parse_args(argv)
+    export(args.model, args.output, args.quantize)
+
+
+if __name__ == "__main__":
+    main()
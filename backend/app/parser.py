@@ -1,110 +1,296 @@
 # backend/app/parser.py
 
+import json
+import os
 import re
-from pathlib import Path
-from tempfile import NamedTemporaryFile
+from io import BytesIO, StringIO
+from typing import BinaryIO, Iterator
 
-from pdfminer.high_level import extract_text
-from .skills import SKILLS, SYNONYMS
+from dotenv import load_dotenv
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from .taxonomy import get_taxonomy
+from .sections import segment_sections, section_text, HEADER_SECTION
+from .cache import ParseCache
+from . import fuzzy_skills
 
-# Lazy load spaCy model to prevent blocking at startup
-_nlp = None
+load_dotenv()
 
-def get_nlp():
-    global _nlp
-    if _nlp is None:
+# Bump whenever parse_resume output changes shape or semantics, so cached
+# results from an older parser are not served.
+PARSER_VERSION = "5"
+
+# PDF extraction budgets. Resumes rarely exceed 3-4 pages; anything past the
+# budget (e.g. a 60-page portfolio) is not laid out at all. 0 = unlimited.
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", 8))
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", 40000))
+# pdfminer layout tuning as JSON, e.g. '{"line_margin": 0.3, "boxes_flow": null}'
+# (boxes_flow=null skips the costly reading-order analysis).
+PDF_LAPARAMS = json.loads(os.getenv("PDF_LAPARAMS") or "{}")
+
+# Lazy load spaCy models to prevent blocking at startup
+SPACY_MODEL = "en_core_web_sm"
+# Components name extraction never uses; "ner" mode skips loading them
+_NON_NER_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter", "morphologizer"]
+# Only the opening of a resume is searched for the candidate's name
+NAME_WINDOW = 1000
+_nlp_pipelines = {}
+
+def get_nlp(mode: str = "full"):
+    """
+    Return a cached spaCy pipeline.
+
+    mode="full": the complete en_core_web_sm pipeline.
+    mode="ner":  only NER (plus tok2vec if NER listens to it).
+    """
+    if mode not in _nlp_pipelines:
         import spacy
-        print("Loading spaCy model...")
-        _nlp = spacy.load("en_core_web_sm")
-        print("spaCy model loaded!")
-        print("spaCy model loaded!")
-    return _nlp
+        print(f"Loading spaCy model ({mode})...")
+        if mode == "ner":
+            nlp = spacy.load(SPACY_MODEL, exclude=_NON_NER_COMPONENTS)
+            if "tok2vec" in nlp.pipe_names:
+                listeners = getattr(nlp.get_pipe("tok2vec"), "listening_components", [])
+                if "ner" not in listeners:
+                    nlp.remove_pipe("tok2vec")
+        elif mode == "full":
+            nlp = spacy.load(SPACY_MODEL)
+        else:
+            raise ValueError(f"Unknown spaCy mode: {mode}")
+        _nlp_pipelines[mode] = nlp
+        print(f"spaCy model loaded! Pipeline: {nlp.pipe_names}")
+    return _nlp_pipelines[mode]
 
 
-def _pdf_bytes_to_text(content: bytes) -> str:
-    """Convert uploaded PDF bytes to text, with a safe fallback."""
+def iter_pdf_pages(stream: BinaryIO, max_pages: int = 0, laparams: LAParams | None = None) -> Iterator[str]:
+    """
+    Yield the text of a PDF one page at a time.
+
+    Pages are laid out lazily, so a caller that stops iterating early never
+    pays for the remaining pages.
+    """
+    rsrcmgr = PDFResourceManager(caching=True)
+    out = StringIO()
+    device = TextConverter(rsrcmgr, out, laparams=laparams or LAParams())
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
     try:
-        with NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
+        for page in PDFPage.get_pages(stream, maxpages=max_pages):
+            interpreter.process_page(page)
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+    finally:
+        device.close()
+
+
+def extract_text_bounded(
+    stream: BinaryIO,
+    max_pages: int = PDF_MAX_PAGES,
+    max_chars: int = PDF_MAX_CHARS,
+    laparams: LAParams | None = None,
+) -> tuple[str, bool]:
+    """
+    Extract PDF text within a page and character budget.
+
+    Returns (text, truncated). Extraction stops at the first page that
+    takes the text past ``max_chars``, or after ``max_pages`` pages.
+    """
+    if laparams is None:
+        laparams = LAParams(**PDF_LAPARAMS)
+    parts: list[str] = []
+    total = 0
+    truncated = False
+    # Ask for one extra page so we can tell "exactly max_pages" from "more"
+    pages = iter_pdf_pages(stream, max_pages + 1 if max_pages else 0, laparams)
+    for page_no, page_text in enumerate(pages):
+        if max_pages and page_no == max_pages:
+            truncated = True
+            break
+        parts.append(page_text)
+        total += len(page_text)
+        if max_chars and total >= max_chars:
+            truncated = True
+            break
+    pages.close()
+
+    text = "".join(parts)
+    if max_chars and len(text) > max_chars:
+        text = text[:max_chars]
+    return text, truncated
 
-        text = extract_text(tmp_path) or ""
-        Path(tmp_path).unlink(missing_ok=True)
+
+def _pdf_bytes_to_text(content: bytes) -> tuple[str, bool]:
+    """Convert uploaded PDF bytes to (text, truncated), with a safe fallback."""
+    try:
+        # pdfminer reads from any binary stream; BytesIO shares the bytes
+        # buffer, so there is no copy and no temp file to clean up.
+        text, truncated = extract_text_bounded(BytesIO(content))
     except Exception:
         # Fallback: treat bytes as utf-8 text
         text = content.decode("utf-8", errors="ignore")
+        truncated = False
+        if PDF_MAX_CHARS and len(text) > PDF_MAX_CHARS:
+            text, truncated = text[:PDF_MAX_CHARS], True
 
-    return text
+    return text, truncated
 
 
-def extract_name(text: str) -> str | None:
-    """Use spaCy NER to extract candidate person name from top of resume."""
-    if not text:
-        return None
-    nlp = get_nlp()
-    doc = nlp(text[:1000])
+def _first_person(doc) -> str | None:
     for ent in doc.ents:
         if ent.label_ == "PERSON":
             return ent.text.strip()
     return None
 
 
+def extract_name(text: str) -> str | None:
+    """Use spaCy NER to extract candidate person name from top of resume."""
+    if not text:
+        return None
+    nlp = get_nlp("ner")
+    return _first_person(nlp(text[:NAME_WINDOW]))
+
+
+def extract_names(texts, batch_size: int = 64, n_process: int = 1) -> list[str | None]:
+    """
+    Batch version of extract_name for bulk ingestion.
+
+    Streams the resume headers through nlp.pipe, which batches them through
+    the model instead of paying per-call overhead for every document.
+    """
+    texts = [t or "" for t in texts]
+    names: list[str | None] = [None] * len(texts)
+    todo = [i for i, t in enumerate(texts) if t]
+    if not todo:
+        return names
+    nlp = get_nlp("ner")
+    docs = nlp.pipe(
+        (texts[i][:NAME_WINDOW] for i in todo),
+        batch_size=batch_size,
+        n_process=n_process,
+    )
+    for i, doc in zip(todo, docs):
+        names[i] = _first_person(doc)
+    return names
+
+
 def extract_skills(text: str) -> list[str]:
-    """Extract skills based on SKILLS + SYNONYMS."""
-    text_low = text.lower()
-    found = set()
-
-    # Create a regex pattern for strict matching
-    # Sort skills by length (descending) so 'c++' matches before 'c'
-    all_skills = sorted(SKILLS, key=len, reverse=True)
-    
-    # Escape special regex chars in skills (like c++, c#, .net)
-    # \b matches word boundary. 
-    # For symbols like C++, \b might not work at the end if followed by space, so we use a more complex pattern or just simple whitespace boundaries
-    # A safe pattern for "C++" is (?<!\w)C\+\+(?!\w)
-    
-    # But for simplicity and performance with this list:
-    for skill in all_skills:
-        # Construct pattern: lookbehind/ahead for non-word char, OR start/end of string
-        # We handle the special cases where skill itself contains non-word chars (like c++, .net)
-        
-        s_esc = re.escape(skill.lower())
-        pattern = r'(?:^|[\s,.\/;:\(\)\[\]])' + s_esc + r'(?:$|[\s,.\/;:\(\)\[\]])'
-        
-        if re.search(pattern, text_low):
-            found.add(skill)
-
-    for syn, real in SYNONYMS.items():
-        s_esc = re.escape(syn)
-        pattern = r'(?:^|[\s,.\/;:\(\)\[\]])' + s_esc + r'(?:$|[\s,.\/;:\(\)\[\]])'
-        if re.search(pattern, text_low):
-            found.add(real)
-
-    return sorted(found)
+    """Extract canonical skills (SKILLS + SYNONYMS) in one pass over the text."""
+    return get_taxonomy().extract(text)
+
+
+# Emails and phones in a single linear scan. An email is only attempted at
+# the start of a run of address characters, and a phone candidate swallows
+# its whole digit/separator run possessively (trimmed afterwards), so long
+# digit-and-space runs from PDF tables cannot trigger backtracking. Runs too
+# short to hold a number are skipped by a fixed-width lookahead.
+_EMAIL_CHARS = r"a-zA-Z0-9+._%-"
+_CONTACT_RE = re.compile(
+    rf"(?<![{_EMAIL_CHARS}])(?P<email>[{_EMAIL_CHARS}]++@[a-zA-Z0-9._%-]+\.[a-zA-Z]{{2,}})"
+    r"|(?P<phone>\+?\d(?=[\d\s\-()]{8})[\d\s\-()]*+)"
+)
+_EMAIL_RE = re.compile(rf"[{_EMAIL_CHARS}]++@[a-zA-Z0-9._%-]+\.[a-zA-Z]{{2,}}")
+_EMAIL_CHARSET = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+._%-")
+_PHONE_MIN_LEN = 9  # \d + 7 separators/digits + \d, as before
+
+
+def _collect_emails(text: str, pos: int, emails: list[str]) -> int:
+    """Match an address at ``pos`` and any glued straight after it; return the end."""
+    while pos < len(text) and text[pos] in _EMAIL_CHARSET:
+        m = _EMAIL_RE.match(text, pos)
+        if m is None:
+            break
+        emails.append(m.group())
+        pos = m.end()
+    return pos
+
+
+def _clean_phone(candidate: str) -> str | None:
+    # Trim trailing separators so the candidate ends on a digit
+    end = len(candidate)
+    while not candidate[end - 1].isdigit():
+        end -= 1
+    if end < _PHONE_MIN_LEN:
+        return None
+    digits_only = "".join(c for c in candidate[:end] if c.isdigit() or c == "+")
+    digit_count = len(digits_only) - digits_only.count("+")
+    return digits_only if 10 <= digit_count <= 14 else None
 
 
 def extract_contacts(text: str) -> tuple[list[str], list[str]]:
     """Extract emails + phone numbers with basic cleanup."""
-    emails = re.findall(
-        r"[a-zA-Z0-9+._%-]+@[a-zA-Z0-9._%-]+\.[a-zA-Z]{2,}",
-        text,
-    )
+    emails: list[str] = []
+    phones: list[str] = []
+    pos = 0
+    while True:
+        m = _CONTACT_RE.search(text, pos)
+        if m is None:
+            break
+        pos = m.end()
 
-    phones_raw = re.findall(r"\+?\d[\d\s\-()]{7,}\d", text)
-    phones_cleaned: list[str] = []
-    for p in phones_raw:
-        digits_only = re.sub(r"[^\d+]", "", p)
-        digit_count = len(re.sub(r"[^\d]", "", digits_only))
-        if 10 <= digit_count <= 14:
-            phones_cleaned.append(digits_only)
+        if m.group("email") is not None:
+            emails.append(m.group("email"))
+            # An address glued to this one's domain ("a@x.com-b@y.com")
+            # does not start a run, so the scan would skip it.
+            pos = _collect_emails(text, pos, emails)
+            continue
+
+        # A phone run may have swallowed the start of an address
+        # ("555-123-4567 2019cs@uni.edu"). If the address run starts inside
+        # the candidate, match it from there; if it reaches back further,
+        # the scan already tried it from the run's true start.
+        end = m.end()
+        if end < len(text) and text[end - 1] in _EMAIL_CHARSET and (
+            text[end] == "@" or text[end] in _EMAIL_CHARSET
+        ):
+            local = end
+            while local > m.start() and text[local - 1] in _EMAIL_CHARSET:
+                local -= 1
+            if local > m.start():
+                pos = max(pos, _collect_emails(text, local, emails))
+
+        phone = _clean_phone(m.group("phone"))
+        if phone:
+            phones.append(phone)
 
     # Deduplicate while keeping order
     emails_unique = list(dict.fromkeys(emails))
-    phones_unique = list(dict.fromkeys(phones_cleaned))
+    phones_unique = list(dict.fromkeys(phones))
 
     return emails_unique, phones_unique
 
 
+def resume_contacts(text: str, sections: dict[str, tuple[int, int]], top: str | None = None) -> tuple[list[str], list[str]]:
+    """
+    Emails and phones of a resume, read from its header and contact sections.
+
+    A field found there comes from there alone; one that isn't (e.g. a phone
+    in a sidebar that pdfminer emits after the main text) falls back to a
+    scan of the full text.
+    """
+    if top is None:
+        top = section_text(text, sections, HEADER_SECTION) or text
+    emails, phones = extract_contacts(section_text(text, sections, HEADER_SECTION, "contact") or top)
+    if not emails or not phones:
+        all_emails, all_phones = extract_contacts(text)
+        emails = emails or all_emails
+        phones = phones or all_phones
+    return emails, phones
+
+
+def _extract_snippet(text: str, sections: dict[str, tuple[int, int]]) -> str:
+    """Short profile blurb: the summary section if present, else the first long lines."""
+    summary = section_text(text, sections, "summary").strip()
+    if len(summary) >= 50:
+        return summary[:500].replace("\n", " ")
+
+    # Fallback: First paragraph that looks like specific content
+    lines = [l.strip() for l in text.split('\n') if len(l.strip()) > 40]
+    if lines:
+        return " ".join(lines[:3])[:600]
+    return text[:600].replace("\r", " ").strip()
+
+
 def parse_resume(content: bytes) -> dict:
     """
     Main parser entrypoint.
@@ -116,32 +302,27 @@ def parse_resume(content: bytes) -> dict:
             "phones": list[str],
             "skills": list[str],
             "snippet": str,      # first 600 chars
-            "full_text": str     # entire extracted resume text
+            "full_text": str,    # extracted resume text (within the page/char budget)
+            "text_truncated": bool,
+            "sections": {name: [start, end]},  # offsets into full_text
+            "taxonomy_version": str,           # taxonomy the skills came from
         }
     """
-    text = _pdf_bytes_to_text(content)
+    text, truncated = _pdf_bytes_to_text(content)
     if not text:
         text = ""
 
-    name = extract_name(text)
-    emails, phones = extract_contacts(text)
-    skills = extract_skills(text)
-
-    skills = extract_skills(text)
-
-    # Improved Snippet Extraction
-    snippet = ""
-    # 1. Try to find "Summary" or "Profile" header
-    summary_match = re.search(r"(?i)(?:summary|profile|objective|about me)[\s:]+(.{50,500})", text, re.DOTALL)
-    if summary_match:
-        snippet = summary_match.group(1).strip().replace("\n", " ")[:600]
-    else:
-        # 2. Fallback: First paragraph that looks like specific content
-        lines = [l.strip() for l in text.split('\n') if len(l.strip()) > 40]
-        if lines:
-            snippet = " ".join(lines[:3])[:600]
-        else:
-            snippet = text[:600].replace("\r", " ").strip()
+    # One pass to locate sections; each extractor then reads only what it needs
+    sections = segment_sections(text)
+    top = section_text(text, sections, HEADER_SECTION) or text
+
+    name = extract_name(top)
+    emails, phones = resume_contacts(text, sections, top)
+    # Skills are mentioned throughout (summary, experience, projects), so
+    # this one still scans the full text.
+    taxonomy = get_taxonomy()
+    skills = taxonomy.extract(text)
+    snippet = _extract_snippet(text, sections)
 
     return {
         "name": name,
@@ -150,4 +331,14 @@ def parse_resume(content: bytes) -> dict:
         "skills": skills,
         "snippet": snippet,
         "full_text": text,
+        "text_truncated": truncated,
+        "sections": {k: [start, end] for k, (start, end) in sections.items()},
+        "taxonomy_version": taxonomy.version,
     }
+
+
+parse_cache = ParseCache(
+    max_entries=int(os.getenv("PARSE_CACHE_SIZE", 128)),
+    disk_dir=os.getenv("PARSE_CACHE_DIR") or None,
+    version=lambda: f"p{PARSER_VERSION}-t{get_taxonomy().version}{fuzzy_skills.cache_tag()}",
+)
@@ -0,0 +1,199 @@
+# backend/app/ranking.py
+"""
+Top-k ranking of a stored resume pool against one JD.
+
+A pool is built once from the JSONL written by app.ingest: every resume is
+embedded (one batched encode) and its skills are kept so they can be packed
+into bitmasks. Ranking a JD is then one encode for the JD, one matrix-vector
+product for similarity, vectorized skill coverage and the array form of the
+scoring formula; only the top-k get the full compute_score breakdown.
+
+Usage (from backend/):
+    python -m app.ranking build parsed.jsonl -o resume_pool/
+    python -m app.ranking rank resume_pool/ --jd jd.txt -k 10
+"""
+import argparse
+import json
+import os
+import threading
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+
+from .embeddings import encode_texts
+from .scoring import score_result, score_arrays
+from .skillset import coverage_many, pack_masks, to_words
+from .taxonomy import Taxonomy, get_taxonomy
+
+load_dotenv()
+
+# Directory of a pool built with `python -m app.ranking build`, served by /rank
+RESUME_POOL_DIR = os.getenv("RESUME_POOL_DIR") or None
+
+_META_FILE = "pool.json"
+_EMBEDDINGS_FILE = "embeddings.npy"
+
+
+class ResumePool:
+    """
+    Precomputed resume embeddings (n, dims) plus each resume's skills.
+
+    Skill bitmasks depend on the taxonomy, so they are packed on first use
+    and re-packed whenever the taxonomy changes.
+    """
+
+    def __init__(self, ids: list[str], skills: list[list[str]], embeddings: np.ndarray):
+        self.ids = ids
+        self.skills = skills
+        self.embeddings = embeddings
+        self._packed: tuple[str, list[int], list[list[str]], np.ndarray] | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_records(cls, records, batch_size: int = 256) -> "ResumePool":
+        """Build from parsed ingest records ({"id", "ok", "parsed": {...}})."""
+        ids, skills, texts = [], [], []
+        for record in records:
+            parsed = record.get("parsed") or {}
+            if not record.get("ok") or not parsed.get("full_text"):
+                continue
+            ids.append(record["id"])
+            skills.append(parsed.get("skills") or [])
+            # Same text compute_score embeds for a resume
+            texts.append(parsed["full_text"].lower())
+
+        chunks = []
+        for start in range(0, len(texts), batch_size):
+            vectors = encode_texts(texts[start:start + batch_size])
+            if vectors is None:
+                raise RuntimeError("SBERT model not available")
+            chunks.append(vectors)
+        embeddings = np.vstack(chunks) if chunks else np.zeros((0, 0), dtype=np.float32)
+        return cls(ids, skills, embeddings)
+
+    @classmethod
+    def from_jsonl(cls, path: str) -> "ResumePool":
+        def records():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # partial line from an interrupted ingest
+        return cls.from_records(records())
+
+    def save(self, pool_dir: str) -> None:
+        os.makedirs(pool_dir, exist_ok=True)
+        np.save(os.path.join(pool_dir, _EMBEDDINGS_FILE), self.embeddings)
+        with open(os.path.join(pool_dir, _META_FILE), "w", encoding="utf-8") as f:
+            json.dump({"ids": self.ids, "skills": self.skills}, f)
+
+    @classmethod
+    def load(cls, pool_dir: str) -> "ResumePool":
+        with open(os.path.join(pool_dir, _META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        embeddings = np.load(os.path.join(pool_dir, _EMBEDDINGS_FILE), mmap_mode="r")
+        return cls(meta["ids"], meta["skills"], embeddings)
+
+    def _masks(self, taxonomy: Taxonomy) -> tuple[list[int], list[list[str]], np.ndarray]:
+        packed = self._packed
+        if packed is None or packed[0] != taxonomy.version:
+            with self._lock:
+                if self._packed is None or self._packed[0] != taxonomy.version:
+                    masks, unknown = [], []
+                    for skills in self.skills:
+                        mask, unk = taxonomy.mask(taxonomy.normalize_all(skills))
+                        masks.append(mask)
+                        unknown.append(unk)
+                    self._packed = (taxonomy.version, masks, unknown,
+                                    pack_masks(masks, taxonomy.mask_words))
+                packed = self._packed
+        return packed[1], packed[2], packed[3]
+
+    def rank(self, jd_text: str, k: int = 10) -> list[dict]:
+        """Top-k resumes for a JD, best first, each with the compute_score breakdown."""
+        jd_text = (jd_text or "").lower()
+        if not jd_text or not len(self):
+            return []
+
+        taxonomy = get_taxonomy()
+        masks, unknown, matrix = self._masks(taxonomy)
+        jd_mask = taxonomy.extract_mask(jd_text)
+        coverage = coverage_many(to_words(jd_mask, taxonomy.mask_words), matrix)["coverage"]
+
+        jd_vector = encode_texts([jd_text])
+        if jd_vector is None:
+            print("SBERT model not available, similarity is 0.0")
+            similarity = np.zeros(len(self))
+        else:
+            similarity = np.clip(self.embeddings @ jd_vector[0], 0.0, 1.0).astype(np.float64)
+
+        skill_scores, jd_scores = score_arrays(coverage, similarity, len(jd_text), jd_mask.bit_count())
+        totals = skill_scores + jd_scores
+        k = min(k, len(self))
+        top = np.argpartition(-totals, k - 1)[:k]
+        top = top[np.argsort(-totals[top], kind="stable")]
+
+        results = []
+        for i in top:
+            result = score_result(
+                taxonomy, masks[i], unknown[i], jd_mask, jd_text,
+                float(skill_scores[i]), float(jd_scores[i]), float(similarity[i]),
+            )
+            result["id"] = self.ids[i]
+            results.append(result)
+        return results
+
+
+_pool: ResumePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_resume_pool() -> ResumePool | None:
+    """The pool in RESUME_POOL_DIR, loaded on first use (None if not configured)."""
+    global _pool
+    if _pool is None and RESUME_POOL_DIR:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ResumePool.load(RESUME_POOL_DIR)
+                print(f"Loaded resume pool ({len(_pool)} resumes) from {RESUME_POOL_DIR}")
+    return _pool
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build or query a ranked resume pool.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="embed an ingest JSONL into a pool directory")
+    build.add_argument("jsonl", help="output of python -m app.ingest")
+    build.add_argument("-o", "--output", required=True, help="pool directory")
+    rank = sub.add_parser("rank", help="rank a pool against a JD")
+    rank.add_argument("pool", help="pool directory")
+    rank.add_argument("--jd", required=True, help="file containing the job description")
+    rank.add_argument("-k", type=int, default=10)
+    args = ap.parse_args(argv)
+
+    if args.command == "build":
+        start = time.perf_counter()
+        pool = ResumePool.from_jsonl(args.jsonl)
+        pool.save(args.output)
+        print(f"Embedded {len(pool)} resumes in {time.perf_counter() - start:.1f}s -> {args.output}")
+        return
+
+    pool = ResumePool.load(args.pool)
+    with open(args.jd, "r", encoding="utf-8") as f:
+        jd_text = f.read()
+    start = time.perf_counter()
+    results = pool.rank(jd_text, args.k)
+    elapsed = time.perf_counter() - start
+    for n, r in enumerate(results, 1):
+        print(f"{n:>3}. {r['final_score']:>6.2f}  {r['id']}  "
+              f"(skills {r['skill_score']}, semantic {r['jd_similarity_score']})")
+    print(f"Ranked {len(pool)} resumes in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# backend/app/rescore.py
+"""
+Re-score saved analyses after a scoring or taxonomy change, without SBERT.
+
+Each row keeps its scoring inputs (raw similarity, resume and JD skills) and
+the scoring/taxonomy versions it was scored with. Only rows behind the
+current versions are visited, in id-ordered chunks, and only the stale parts
+are recomputed:
+
+- scoring formula changed: scores come from the stored skills and similarity
+- taxonomy changed: JD skills and role are re-extracted from the stored
+  job_description and resume skills re-normalized; the similarity is reused
+
+Rows saved before these inputs were stored get them derived once: the
+similarity from the stored embeddings when both exist, else inverted from
+semantic_score, and the resume skills from bonus_skills plus the matched
+JD skills. The resume text is not stored, so skills a new taxonomy would
+find in the resume itself can't be added.
+
+Run from backend/:
+    python -m app.rescore [--chunk-size 1000] [--all]
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from .analysis_embeddings import load_embeddings
+from .models import Analysis
+from .scoring import (
+    SCORING_VERSION, round_similarity, score_arrays, score_result, similarity_from_jd_score,
+)
+from .skillset import coverage_many, pack_masks
+from .taxonomy import Taxonomy, get_taxonomy
+
+_COLUMNS = (
+    Analysis.id, Analysis.job_title, Analysis.job_description, Analysis.match_score, Analysis.semantic_score,
+    Analysis.missing_skills, Analysis.bonus_skills, Analysis.similarity_raw,
+    Analysis.resume_skills, Analysis.jd_skills, Analysis.taxonomy_version,
+)
+
+
+def _load(value: str | None) -> list[str]:
+    try:
+        return json.loads(value) if value else []
+    except ValueError:
+        return []
+
+
+def _recover_similarity(db: Session, rows: list, jd_masks: list[int]) -> dict[int, float]:
+    """Similarity for rows saved without similarity_raw, keyed by analysis id."""
+    ids = [r.id for r in rows]
+    resume_ids, resumes = load_embeddings(db, "resume_embedding", ids=ids)
+    jd_ids, jds = load_embeddings(db, "jd_embedding", ids=ids)
+    # Both come back in id order; keep the rows that have both vectors
+    both, resume_rows, jd_rows = np.intersect1d(resume_ids, jd_ids, return_indices=True)
+    recovered = {}
+    if len(both):
+        sims = np.clip(np.einsum("ij,ij->i", resumes[resume_rows], jds[jd_rows]), 0.0, 1.0)
+        recovered.update(zip(both.tolist(), sims.tolist()))
+    rest = [(row, jd_mask) for row, jd_mask in zip(rows, jd_masks) if row.id not in recovered]
+    if rest:
+        # Approximate, since semantic_score was stored rounded
+        sims = similarity_from_jd_score(
+            [row.semantic_score or 0.0 for row, _ in rest],
+            [len(row.job_description or "") for row, _ in rest],
+            [jd_mask.bit_count() for _, jd_mask in rest],
+        )
+        recovered.update(zip((row.id for row, _ in rest), sims.tolist()))
+    return recovered
+
+
+def rescore_rows(db: Session, rows: list, taxonomy: Taxonomy) -> list[dict]:
+    """Update mappings (id + recomputed columns) for one chunk of rows."""
+    jd_texts = [(r.job_description or "").lower() for r in rows]
+    jd_masks, resume_masks, resume_unknowns, roles = [], [], [], []
+    for row, jd in zip(rows, jd_texts):
+        current = row.taxonomy_version == taxonomy.version
+        if current and row.jd_skills is not None:
+            jd_mask = taxonomy.mask(_load(row.jd_skills))[0]
+        else:
+            jd_mask = taxonomy.extract_mask(jd)
+        if row.resume_skills is not None:
+            resume_skills = _load(row.resume_skills)
+        else:
+            # Legacy row: bonus skills plus the JD skills that weren't missing
+            missing = set(_load(row.missing_skills))
+            resume_skills = _load(row.bonus_skills) + [
+                s for s in taxonomy.skills_from_mask(jd_mask) if s not in missing
+            ]
+        if not current:
+            resume_skills = taxonomy.normalize_all(resume_skills)
+        resume_mask, unknown = taxonomy.mask(resume_skills)
+        jd_masks.append(jd_mask)
+        resume_masks.append(resume_mask)
+        resume_unknowns.append(sorted(unknown))
+        # Role keywords are part of the taxonomy; the role only moves with it
+        roles.append((row.job_title, {}) if current else None)
+
+    todo = [n for n, row in enumerate(rows) if row.similarity_raw is None]
+    recovered = (_recover_similarity(db, [rows[n] for n in todo], [jd_masks[n] for n in todo])
+                 if todo else {})
+    similarity = np.array(
+        [r.similarity_raw if r.similarity_raw is not None else recovered[r.id] for r in rows],
+        dtype=np.float64,
+    )
+
+    words = taxonomy.mask_words
+    coverage = coverage_many(pack_masks(jd_masks, words), pack_masks(resume_masks, words))
+    skill_scores, jd_scores = score_arrays(
+        coverage["coverage"], similarity,
+        [len(jd) for jd in jd_texts], [m.bit_count() for m in jd_masks],
+    )
+
+    mappings = []
+    for n, row in enumerate(rows):
+        result = score_result(
+            taxonomy, resume_masks[n], resume_unknowns[n], jd_masks[n], jd_texts[n],
+            float(skill_scores[n]), float(jd_scores[n]), float(similarity[n]), role=roles[n],
+        )
+        resume_skills = sorted(
+            taxonomy.skills_from_mask(resume_masks[n]) + resume_unknowns[n]
+        )
+        mappings.append({
+            "id": row.id,
+            "job_title": result["role"],
+            "match_score": result["final_score"],
+            "skill_score": result["skill_score"],
+            "semantic_score": result["jd_similarity_score"],
+            "missing_skills": json.dumps(result["missing_skills"]),
+            "bonus_skills": json.dumps(result["resume_extra_skills"]),
+            "similarity_raw": float(round_similarity(similarity[n])),
+            "resume_skills": json.dumps(resume_skills),
+            "jd_skills": json.dumps(taxonomy.skills_from_mask(jd_masks[n])),
+            "taxonomy_version": taxonomy.version,
+            "scoring_version": SCORING_VERSION,
+        })
+    return mappings
+
+
+def rescore(db: Session, chunk_size: int = 1000, force: bool = False) -> dict:
+    """
+    Re-score every analysis behind the current scoring and taxonomy versions
+    (every analysis with ``force``), committing one bulk UPDATE per chunk.
+    """
+    taxonomy = get_taxonomy()
+    query = db.query(*_COLUMNS)
+    if not force:
+        query = query.filter(or_(
+            Analysis.scoring_version.is_(None),
+            Analysis.scoring_version != SCORING_VERSION,
+            Analysis.taxonomy_version.is_(None),
+            Analysis.taxonomy_version != taxonomy.version,
+        ))
+
+    start = time.perf_counter()
+    done = changed = 0
+    last_id = 0
+    while True:
+        rows = query.filter(Analysis.id > last_id).order_by(Analysis.id).limit(chunk_size).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        mappings = rescore_rows(db, rows, taxonomy)
+        db.execute(update(Analysis), mappings)
+        db.commit()
+        done += len(rows)
+        changed += sum(1 for row, m in zip(rows, mappings) if row.match_score != m["match_score"])
+        rate = done / (time.perf_counter() - start)
+        print(f"  {done} rows re-scored, {changed} scores changed ({rate:.1f} rows/sec)")
+
+    elapsed = time.perf_counter() - start
+    rate = done / elapsed if elapsed else 0.0
+    print(f"Re-scored {done} analyses in {elapsed:.1f}s ({rate:.1f} rows/sec), "
+          f"scoring v{SCORING_VERSION}, taxonomy {taxonomy.version}")
+    return {
+        "rows": done,
+        "changed": changed,
+        "elapsed_s": round(elapsed, 2),
+        "rows_per_sec": round(rate, 1),
+    }
+
+
+def main(argv=None):
+    from .database import SessionLocal, init_db
+
+    ap = argparse.ArgumentParser(description="Re-score saved analyses with the current scoring and taxonomy.")
+    ap.add_argument("--chunk-size", type=int, default=1000)
+    ap.add_argument("--all", action="store_true", help="re-score every analysis, not only stale ones")
+    args = ap.parse_args(argv)
+
+    init_db()
+    db = SessionLocal()
+    try:
+        rescore(db, args.chunk_size, force=args.all)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# backend/app/scoring.py
+"""
+Resume/JD match scoring.
+
+compute_score scores one pair; compute_scores scores one resume against
+many JDs with the resume's skills extracted once, every text embedded in a
+single batched encode, and the scoring formula evaluated on arrays. Both go
+through the same code, so a batch result is identical to the /score result
+for the same pair.
+"""
+import numpy as np
+
+from .embeddings import encode_texts
+from .skillset import coverage_many, pack_masks, to_words
+from .taxonomy import Taxonomy, get_taxonomy
+
+
+# Bump when score_arrays / score_result change, so stored analyses can be
+# found and re-scored (python -m app.rescore)
+SCORING_VERSION = "2"
+
+
+def detect_role(jd_text: str) -> tuple[str, dict]:
+    """
+    Return (role, role_scores) for a JD.
+
+    role_scores maps each role with at least one keyword hit to its hit count
+    and confidence (share of all role keyword hits), best first.
+    """
+    jd_len = len(jd_text)
+
+    # If JD is too short, don't guess a specific role
+    if jd_len < 40:
+        return "Generic / Undefined Role", {}
+
+    hits = get_taxonomy().role_hits(jd_text)
+
+    # If no specific keywords matched despite reasonable length, call it general
+    if not hits:
+        return ("Software Professional" if jd_len < 300 else "General Software Engineer"), {}
+
+    total = sum(hits.values())
+    # Stable sort keeps catalog order on ties, so the first role listed wins
+    ranked = sorted(hits.items(), key=lambda item: item[1], reverse=True)
+    role_scores = {
+        role: {"hits": n, "confidence": round(n / total, 4)}
+        for role, n in ranked
+    }
+    return ranked[0][0], role_scores
+
+
+# Similarity is rounded once, before scoring, to what is reported and stored
+# as similarity_raw, so stored scores can be recomputed from it exactly
+SIMILARITY_DECIMALS = 4
+
+
+def round_similarity(similarity) -> np.ndarray:
+    return np.round(np.clip(np.asarray(similarity, dtype=np.float64), 0.0, 1.0), SIMILARITY_DECIMALS)
+
+
+def length_multiplier(jd_len) -> np.ndarray:
+    """JD Depth Penalty: scales both scores down for short JDs."""
+    jd_len = np.asarray(jd_len)
+    return np.select([jd_len < 50, jd_len < 200, jd_len < 600], [0.2, 0.5, 0.85], 1.0)
+
+
+def semantic_weight(jd_skill_count) -> np.ndarray:
+    """Points per unit of similarity: more when the JD has no skills to match."""
+    return np.where(np.asarray(jd_skill_count) == 0, 50.0, 25.0)
+
+
+def score_arrays(coverage, similarity, jd_len, jd_skill_count) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The scoring formula over arrays of pairs; returns (skill_score, jd_score).
+
+    coverage:       matched JD skills / JD skills (0 when the JD has none)
+    similarity:     resume/JD cosine similarity
+    jd_len:         JD length in characters
+    jd_skill_count: number of skills found in the JD
+    """
+    coverage = np.asarray(coverage, dtype=np.float64)
+    jd_len = np.asarray(jd_len)
+    count = np.asarray(jd_skill_count)
+    # Clamp between 0 and 1
+    similarity = round_similarity(similarity)
+
+    # 1. Skill Match (Primary Factor)
+    skill_score = coverage * 75.0  # Max 75 points from skills
+
+    # 2. JD Depth Penalty (Prevents inflated scores for low-effort or single-word JDs)
+    len_mult = length_multiplier(jd_len)
+    skill_mult = np.select(
+        [count == 0, count == 1, count == 2, count <= 4], [0.0, 0.35, 0.65, 0.9], 1.0
+    )
+    # Final quality multiplier (weighted average)
+    quality_multiplier = (len_mult * 0.4) + (skill_mult * 0.6)
+
+    # 3. Semantic Similarity (Secondary Factor)
+    # If JD has no skills, rely more on semantic but penalize valid "tech" comparison
+    jd_score = np.where((count == 0) & (similarity < 0.5), 0.0, similarity * semantic_weight(count))
+
+    # Apply the JD Depth Penalty to both scores
+    return skill_score * quality_multiplier, jd_score * len_mult
+
+
+def similarity_from_jd_score(jd_score, jd_len, jd_skill_count) -> np.ndarray:
+    """
+    Invert score_arrays' jd_score back to the similarity that produced it.
+
+    Approximate when jd_score was rounded; a JD without skills whose
+    similarity was under 0.5 scored 0 and comes back as 0.
+    """
+    weight = semantic_weight(jd_skill_count) * length_multiplier(jd_len)
+    return np.clip(np.asarray(jd_score, dtype=np.float64) / weight, 0.0, 1.0)
+
+
+def score_result(
+    taxonomy: Taxonomy,
+    resume_mask: int,
+    resume_unknown: list[str],
+    jd_mask: int,
+    jd_text: str,
+    skill_score: float,
+    jd_score: float,
+    similarity: float,
+    role: tuple[str, dict] | None = None,
+) -> dict:
+    """
+    Build the compute_score response for one pair from its precomputed parts.
+
+    ``role`` is a detect_role result to reuse instead of re-detecting.
+    """
+    # If JD is extremely short and has no detected skills, return 0
+    if len(jd_text) < 10 and not jd_mask:
+        return {
+            "final_score": 0.0,
+            "skill_score": 0.0,
+            "jd_similarity_score": 0.0,
+            "similarity_raw": 0.0,
+            "matched_jd_skills": [],
+            "missing_skills": [],
+            "resume_extra_skills": [],
+            "role": "Unknown",
+            "role_confidence": 0.0,
+            "role_scores": {},
+            "taxonomy_version": taxonomy.version,
+        }
+
+    # Bit order is alphabetical, so skill lists come out sorted
+    matched_jd_skills = taxonomy.skills_from_mask(jd_mask & resume_mask)
+    missing_skills = taxonomy.skills_from_mask(jd_mask & ~resume_mask)
+    resume_extra_skills = sorted(taxonomy.skills_from_mask(resume_mask & ~jd_mask) + resume_unknown)
+
+    # Cap at 100
+    final_score = min(100.0, round(skill_score + jd_score, 2))
+    detected_role, role_scores = role or detect_role(jd_text)
+
+    return {
+        "final_score": float(final_score),
+        "skill_score": float(round(skill_score, 2)),
+        "jd_similarity_score": float(round(jd_score, 2)),
+        "similarity_raw": float(round_similarity(similarity)),
+        "matched_jd_skills": matched_jd_skills,
+        "missing_skills": missing_skills,
+        "resume_extra_skills": resume_extra_skills,
+        "role": detected_role,
+        "role_confidence": role_scores[detected_role]["confidence"] if role_scores else 0.0,
+        "role_scores": role_scores,
+        "taxonomy_version": taxonomy.version,
+    }
+
+
+def compute_scores(resume_text: str, jd_texts: list[str], resume_skills_input: list[str] | None = None) -> list[dict]:
+    """Score one resume against many JDs; one result per JD, in order."""
+    resume_text = (resume_text or "").lower()
+    jd_texts = [(jd or "").lower() for jd in jd_texts]
+    resume_skills_input = resume_skills_input or []
+
+    results: list[dict] = [{"error": "Resume or JD missing"} for _ in jd_texts]
+    todo = [i for i, jd in enumerate(jd_texts) if jd] if resume_text else []
+    if not todo:
+        return results
+    jds = [jd_texts[i] for i in todo]
+
+    # Skill sets are bitmasks over taxonomy IDs; the resume's is built once
+    taxonomy = get_taxonomy()
+    resume_mask, resume_unknown = taxonomy.mask(taxonomy.normalize_all(resume_skills_input))
+    if not resume_mask and not resume_unknown:
+        resume_mask = taxonomy.extract_mask(resume_text)
+    jd_masks = [taxonomy.extract_mask(jd) for jd in jds]
+
+    words = taxonomy.mask_words
+    coverage = coverage_many(pack_masks(jd_masks, words), to_words(resume_mask, words))
+
+    # Resume and every JD are embedded in one batched call
+    try:
+        embeddings = encode_texts([resume_text] + jds)
+        if embeddings is None:
+            print("SBERT model not available, similarity is 0.0")
+            similarity = np.zeros(len(jds))
+        else:
+            similarity = np.clip(embeddings[1:] @ embeddings[0], 0.0, 1.0).astype(np.float64)
+    except Exception as e:
+        print(f"Similarity error: {e}")
+        similarity = np.zeros(len(jds))
+
+    skill_scores, jd_scores = score_arrays(
+        coverage["coverage"],
+        similarity,
+        [len(jd) for jd in jds],
+        [m.bit_count() for m in jd_masks],
+    )
+
+    for n, i in enumerate(todo):
+        results[i] = score_result(
+            taxonomy, resume_mask, resume_unknown, jd_masks[n], jds[n],
+            float(skill_scores[n]), float(jd_scores[n]), float(similarity[n]),
+        )
+    return results
+
+
+def compute_score(resume_text: str, jd_text: str, resume_skills_input: list[str] | None = None) -> dict:
+    """Compute match score between resume and JD"""
+    return compute_scores(resume_text, [jd_text], resume_skills_input)[0]
@@ -0,0 +1,86 @@
+# backend/app/sections.py
+
+import re
+
+# Canonical section -> header spellings seen in resumes
+SECTION_HEADERS = {
+    "summary": [
+        "summary", "professional summary", "career summary", "profile",
+        "professional profile", "objective", "career objective", "about me",
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "employment",
+        "employment history", "work history", "career history", "internships",
+    ],
+    "education": [
+        "education", "academic background", "academics", "qualifications",
+        "education and training",
+    ],
+    "skills": [
+        "skills", "technical skills", "core skills", "key skills", "core competencies",
+        "competencies", "technologies", "tech stack", "tools and technologies",
+    ],
+    "projects": ["projects", "personal projects", "key projects", "academic projects"],
+    "certifications": ["certifications", "certificates", "licenses and certifications"],
+    "contact": [
+        "contact", "contact information", "contact details", "personal details",
+        "personal information",
+    ],
+}
+
+# Text before the first recognised header (usually name + contact line)
+HEADER_SECTION = "header"
+
+_HEADER_TO_SECTION = {
+    alias: section for section, aliases in SECTION_HEADERS.items() for alias in aliases
+}
+
+# A header is a line that is only the section title (optionally bulleted,
+# optionally followed by ":" and inline content, e.g. "Skills: Python, Go").
+_HEADER_RE = re.compile(
+    r"^[ \t]*(?:[#*•\-–][ \t]*)?("
+    + "|".join(re.escape(a) for a in sorted(_HEADER_TO_SECTION, key=len, reverse=True))
+    + r")[ \t]*(?::[ \t]*|$)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def segment_sections(text: str) -> dict[str, tuple[int, int]]:
+    """
+    Split resume text into sections in a single regex scan.
+
+    Returns {section: (start, end)} character offsets into ``text``, covering
+    the section body (the header line itself is excluded). The first
+    occurrence of a section wins; text before the first header is reported
+    as "header".
+    """
+    sections: dict[str, tuple[int, int]] = {}
+    if not text:
+        return sections
+
+    current = HEADER_SECTION
+    body_start = 0
+    for m in _HEADER_RE.finditer(text):
+        if current not in sections and m.start() > body_start:
+            sections[current] = (body_start, m.start())
+        current = _HEADER_TO_SECTION[m.group(1).lower()]
+        body_start = m.end()
+
+    if current not in sections and len(text) > body_start:
+        sections[current] = (body_start, len(text))
+    return sections
+
+
+def section_text(text: str, sections: dict[str, tuple[int, int]], *names: str) -> str:
+    """Concatenate the text of the named sections (in document order)."""
+    spans = sorted(sections[n] for n in names if n in sections)
+    return "\n".join(text[start:end] for start, end in spans)
+
+
+def section_boundaries(text: str) -> list[int]:
+    """Offsets where each section starts: 0 plus every header line, in order."""
+    starts = [0]
+    for m in _HEADER_RE.finditer(text):
+        if m.start() > starts[-1]:
+            starts.append(m.start())
+    return starts
@@ -19,9 +19,9 @@ SKILLS = [
     "sql server", "firebase",
 
     # Cloud / DevOps (Expanded)
-    "aws", "azure", "gcp", "google cloud", "amazon web services",
+    "aws", "azure", "gcp",
     "docker", "kubernetes", "terraform", "ansible", "puppet", "chef",
-    "jenkins", "github actions", "gitlab ci", "circleci", "travis ci",
+    "jenkins", "ci/cd", "github actions", "gitlab ci", "circleci", "travis ci",
     "prometheus", "grafana", "splunk", "elk stack", "datadog", "new relic",
     "serverless", "lambda", "ec2", "s3", "fargate", "eks", "aks", "gke",
 
@@ -34,8 +34,8 @@ SKILLS = [
 
     # Blockchain / Web3
     "blockchain", "solidity", "web3", "smart contracts", "ethereum", "bitcoin",
-    "hyperledger", "rust", "truffle", "hardhat", "ganache", "ipfs",
-    "defi", "nfts", "cryptography", "consensus algorithms",
+    "hyperledger", "truffle", "hardhat", "ganache", "ipfs",
+    "defi", "nfts", "consensus algorithms",
 
     # OS / scripting
     "linux", "bash", "powershell", "shell scripting", "unix",
@@ -54,11 +54,11 @@ SKILLS = [
     "kafka", "rabbitmq", "sqs", "sns", "kinesis",
 
     # Mobile
-    "android", "ios", "flutter", "react native", "swiftui", "kotlin", "swift", "dart",
+    "android", "ios", "flutter", "react native", "swiftui", "dart",
 
     # Generic SWE / tools
     "git", "github", "gitlab", "jira", "confluence", "agile", "scrum", "kanban",
-    "rest api", "graphql", "grpc", "microservices", "software architecture", "design patterns",
+    "grpc", "microservices", "software architecture", "design patterns",
 ]
 
 # Synonyms / alternate spellings mapped to canonical skills above
@@ -0,0 +1,81 @@
+# backend/app/skillset.py
+"""
+Skill sets as bitmasks over taxonomy skill IDs.
+
+A single skill set is a Python int (bit i set = taxonomy.skills[i] present),
+so coverage/gap/extra are a few bitwise ops plus int.bit_count(). Many skill
+sets are packed into a (n, words) uint64 NumPy matrix so one JD can be
+scored against thousands of resumes in a handful of vectorized operations.
+"""
+import numpy as np
+
+_WORD_BITS = 64
+# Popcount lookup for one byte; fallback for NumPy < 2.0 (no np.bitwise_count)
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def mask_of(skills, skill_ids: dict[str, int]) -> tuple[int, list[str]]:
+    """Return (mask, unknown) for an iterable of canonical skill names."""
+    mask = 0
+    unknown = []
+    for skill in skills:
+        idx = skill_ids.get(skill)
+        if idx is None:
+            unknown.append(skill)
+        else:
+            mask |= 1 << idx
+    return mask, unknown
+
+
+def skills_of(mask: int, skills: tuple[str, ...]) -> list[str]:
+    """Skill names for the set bits of ``mask``, in ID order."""
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(skills[low.bit_length() - 1])
+        mask ^= low
+    return out
+
+
+def n_words(n_skills: int) -> int:
+    return max(1, (n_skills + _WORD_BITS - 1) // _WORD_BITS)
+
+
+def to_words(mask: int, words: int) -> np.ndarray:
+    """Pack one int mask into a little-endian uint64 word vector."""
+    return np.frombuffer(mask.to_bytes(words * 8, "little"), dtype="<u8").astype(np.uint64)
+
+
+def pack_masks(masks, words: int) -> np.ndarray:
+    """Pack int masks into an (n, words) uint64 matrix."""
+    buf = b"".join(m.to_bytes(words * 8, "little") for m in masks)
+    return np.frombuffer(buf, dtype="<u8").astype(np.uint64).reshape(-1, words)
+
+
+def popcount_rows(matrix: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a uint64 matrix."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(matrix).sum(axis=-1, dtype=np.int64)
+    as_bytes = np.ascontiguousarray(matrix).view(np.uint8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+def coverage_many(jd_words: np.ndarray, resume_matrix: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Score JD skill vectors against resume skill vectors, row by row.
+
+    Either side may be a single vector that is broadcast against the other:
+    one JD against many resumes, or many JDs against one resume. Returns
+    per-row arrays: matched, missing and extra counts, and coverage
+    (matched / JD skills; 0 when the JD has no skills).
+    """
+    jd_words = np.atleast_2d(jd_words)
+    resume_matrix = np.atleast_2d(resume_matrix)
+    jd_count = popcount_rows(jd_words)
+    matched = popcount_rows(resume_matrix & jd_words)
+    extra = popcount_rows(resume_matrix & ~jd_words)
+    missing = jd_count - matched
+    coverage = np.divide(
+        matched, jd_count, out=np.zeros(matched.shape), where=jd_count > 0
+    )
+    return {"matched": matched, "missing": missing, "extra": extra, "coverage": coverage}
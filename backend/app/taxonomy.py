@@ -0,0 +1,260 @@
+# backend/app/taxonomy.py
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+from dotenv import load_dotenv
+
+from .matcher import PhraseMatcher, WORD_BOUNDARY
+from .skillset import mask_of, skills_of, n_words
+from .skills import SKILLS, SYNONYMS, ROLE_KEYWORDS
+
+load_dotenv()
+
+# Optional external taxonomy (JSON, or YAML if PyYAML is installed) with any of
+# the keys "skills", "synonyms", "role_keywords"; missing keys fall back to
+# the built-in lists in skills.py.
+TAXONOMY_PATH = os.getenv("TAXONOMY_PATH") or None
+# Seconds between checks of TAXONOMY_PATH for changes (0 disables watching)
+TAXONOMY_WATCH_INTERVAL = float(os.getenv("TAXONOMY_WATCH_INTERVAL", 30))
+
+
+def _norm(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+class Taxonomy:
+    """
+    Compiled, read-only view of the skill taxonomy.
+
+    Built once from the raw SKILLS / SYNONYMS / ROLE_KEYWORDS data:
+      - skills:     deduplicated canonical skills, sorted; a skill's index is
+                    its ID (so ID order is also output order)
+      - aliases:    normalized term -> canonical skill, for every canonical
+                    skill and synonym
+      - conflicts:  problems found while compiling (duplicates, terms that are
+                    both canonical and a synonym, synonym targets that are
+                    not canonical skills)
+      - role_keywords: role -> normalized keywords
+      - role_matcher: keyword -> roles, matched on word boundaries so every
+                    role is scored in one scan of a JD
+    When a term is both a canonical skill and a synonym of another skill,
+    the synonym wins ("google cloud" is reported as "gcp").
+    """
+
+    def __init__(self, skills, synonyms: dict, role_keywords: dict):
+        conflicts: list[dict] = []
+
+        seen: set[str] = set()
+        canonical: list[str] = []
+        for skill in skills:
+            term = _norm(skill)
+            if term in seen:
+                conflicts.append({"type": "duplicate_skill", "term": term})
+                continue
+            seen.add(term)
+            canonical.append(term)
+
+        alias_map: dict[str, str] = {}
+        for syn, real in synonyms.items():
+            term, target = _norm(syn), _norm(real)
+            if term in alias_map and alias_map[term] != target:
+                conflicts.append({"type": "duplicate_synonym", "term": term,
+                                  "targets": [alias_map[term], target]})
+                continue
+            alias_map[term] = target
+
+        for term, target in alias_map.items():
+            if term in seen and term != target:
+                conflicts.append({"type": "canonical_is_synonym", "term": term, "target": target})
+                canonical.remove(term)
+                seen.discard(term)
+        for term, target in alias_map.items():
+            if target not in seen:
+                conflicts.append({"type": "synonym_target_not_canonical", "term": term, "target": target})
+                seen.add(target)
+                canonical.append(target)
+
+        self.skills: tuple[str, ...] = tuple(sorted(sys.intern(s) for s in canonical))
+        self.skill_ids: dict[str, int] = {s: i for i, s in enumerate(self.skills)}
+        self.aliases: dict[str, str] = {s: s for s in self.skills}
+        for term, target in alias_map.items():
+            self.aliases[term] = self.skills[self.skill_ids[target]]
+        self.role_keywords: dict[str, tuple[str, ...]] = {
+            role: tuple(dict.fromkeys(_norm(k) for k in keywords))
+            for role, keywords in role_keywords.items()
+        }
+        self.conflicts: list[dict] = conflicts
+
+        self.skill_matcher = PhraseMatcher({term: (skill,) for term, skill in self.aliases.items()})
+        keyword_roles: dict[str, list[str]] = {}
+        for role, keywords in self.role_keywords.items():
+            for kw in keywords:
+                keyword_roles.setdefault(kw, []).append(role)
+        self.role_matcher = PhraseMatcher(keyword_roles, boundary=WORD_BOUNDARY)
+
+        payload = json.dumps(
+            [self.skills, sorted(self.aliases.items()), sorted(self.role_keywords.items())],
+            sort_keys=True,
+        )
+        self.version: str = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def extract(self, text: str) -> list[str]:
+        """Canonical skills mentioned in ``text``, sorted."""
+        return sorted(self.skill_matcher.find(text.lower()))
+
+    def extract_mask(self, text: str) -> int:
+        """Skills in ``text`` as a bitmask over skill IDs."""
+        return mask_of(self.skill_matcher.find(text.lower()), self.skill_ids)[0]
+
+    def mask(self, skills) -> tuple[int, list[str]]:
+        """(bitmask, unknown) for canonical skill names; unknown ones can't be set as bits."""
+        return mask_of(skills, self.skill_ids)
+
+    def skills_from_mask(self, mask: int) -> list[str]:
+        """Skill names for a bitmask, sorted."""
+        return skills_of(mask, self.skills)
+
+    @property
+    def mask_words(self) -> int:
+        """uint64 words needed to pack one skill vector."""
+        return n_words(len(self.skills))
+
+    def role_hits(self, text: str) -> dict[str, int]:
+        """Distinct keyword hits per role (roles with no hits omitted), in catalog order."""
+        counts: dict[str, int] = {}
+        for kw in self.role_matcher.matched_phrases(text.lower()):
+            for role in self.role_matcher.values[kw]:
+                counts[role] = counts.get(role, 0) + 1
+        return {role: counts[role] for role in self.role_keywords if role in counts}
+
+    def normalize(self, term: str) -> str:
+        """Map a skill name or alias to its canonical form (unknown terms: normalized as-is)."""
+        term = _norm(term)
+        return self.aliases.get(term, term)
+
+    def normalize_all(self, terms) -> set[str]:
+        return {self.normalize(t) for t in terms if t and t.strip()}
+
+    def conflict_report(self) -> str:
+        if not self.conflicts:
+            return "No taxonomy conflicts."
+        lines = [f"{len(self.conflicts)} taxonomy conflict(s):"]
+        for c in self.conflicts:
+            detail = ", ".join(f"{k}={v}" for k, v in c.items() if k != "type")
+            lines.append(f"  - {c['type']}: {detail}")
+        return "\n".join(lines)
+
+
+def compile_taxonomy(skills=SKILLS, synonyms=SYNONYMS, role_keywords=ROLE_KEYWORDS) -> Taxonomy:
+    taxonomy = Taxonomy(skills, synonyms, role_keywords)
+    if taxonomy.conflicts:
+        print(taxonomy.conflict_report())
+    return taxonomy
+
+
+def load_taxonomy_file(path: str) -> Taxonomy:
+    """Read and compile a taxonomy file (does not install it)."""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise RuntimeError("PyYAML is required for YAML taxonomy files (pip install pyyaml)")
+            data = yaml.safe_load(f) or {}
+        else:
+            data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a mapping with skills/synonyms/role_keywords")
+    return compile_taxonomy(
+        data.get("skills", SKILLS),
+        data.get("synonyms", SYNONYMS),
+        data.get("role_keywords", ROLE_KEYWORDS),
+    )
+
+
+def _initial_taxonomy() -> Taxonomy:
+    if TAXONOMY_PATH:
+        try:
+            taxonomy = load_taxonomy_file(TAXONOMY_PATH)
+            print(f"Loaded taxonomy {taxonomy.version} from {TAXONOMY_PATH}")
+            return taxonomy
+        except Exception as e:
+            print(f"Failed to load taxonomy from {TAXONOMY_PATH}, using built-in: {e}")
+    return compile_taxonomy()
+
+
+_taxonomy = _initial_taxonomy()
+_reload_lock = threading.Lock()
+_watcher = None
+
+
+def get_taxonomy() -> Taxonomy:
+    """The current taxonomy. Read it once per operation; it may be swapped between calls."""
+    return _taxonomy
+
+
+def reload_taxonomy(path: str | None = None) -> Taxonomy:
+    """
+    Compile the taxonomy file and swap it in.
+
+    Compilation happens before the swap, so readers keep using the old
+    taxonomy until the new one is complete; the swap itself is a single
+    reference assignment. Raises (and keeps the old taxonomy) if the file
+    is invalid.
+    """
+    global _taxonomy
+    path = path or TAXONOMY_PATH
+    with _reload_lock:
+        taxonomy = load_taxonomy_file(path) if path else compile_taxonomy()
+        if taxonomy.version != _taxonomy.version:
+            print(f"Taxonomy updated: {_taxonomy.version} -> {taxonomy.version}")
+            _taxonomy = taxonomy
+        return _taxonomy
+
+
+def ensure_taxonomy(version: str) -> Taxonomy:
+    """Reload from TAXONOMY_PATH if this process is behind ``version`` (used by workers)."""
+    if _taxonomy.version != version and TAXONOMY_PATH:
+        try:
+            reload_taxonomy()
+        except Exception as e:
+            print(f"Taxonomy reload failed: {e}")
+    return _taxonomy
+
+
+def _watch(path: str, interval: float) -> None:
+    last_mtime = None
+    while True:
+        try:
+            mtime = os.stat(path).st_mtime
+            if last_mtime is not None and mtime != last_mtime:
+                reload_taxonomy(path)
+            last_mtime = mtime
+        except Exception as e:
+            print(f"Taxonomy watcher: {e}")
+        time.sleep(interval)
+
+
+def start_taxonomy_watcher(interval: float = TAXONOMY_WATCH_INTERVAL) -> None:
+    """Poll TAXONOMY_PATH in a background thread and hot-swap on change."""
+    global _watcher
+    if _watcher is not None or not TAXONOMY_PATH or interval <= 0:
+        return
+    _watcher = threading.Thread(target=_watch, args=(TAXONOMY_PATH, interval), daemon=True)
+    _watcher.start()
+
+
+if __name__ == "__main__":
+    # python -m app.taxonomy  -> summary + conflict report
+    t = get_taxonomy()
+    print(f"Taxonomy {t.version}: {len(t.skills)} skills, {len(t.aliases)} terms, "
+          f"{len(t.role_keywords)} roles")
+    print(t.conflict_report())
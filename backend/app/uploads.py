@@ -0,0 +1,135 @@
+# backend/app/uploads.py
+
+import hashlib
+import os
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, UploadFile
+
+load_dotenv()
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_RESUME_BYTES = int(float(os.getenv("MAX_RESUME_MB", 10)) * 1024 * 1024)
+MAX_AVATAR_BYTES = int(float(os.getenv("MAX_AVATAR_MB", 2)) * 1024 * 1024)
+# Slack for multipart boundaries/headers on top of the file itself
+_MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadTooLarge(HTTPException):
+    """413 raised as soon as an upload is known to exceed its limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(
+            status_code=413,
+            detail=f"File too large (limit {max_bytes // (1024 * 1024)} MB)",
+        )
+
+
+class UploadLimitMiddleware:
+    """
+    ASGI middleware that caps request bodies for upload routes.
+
+    Rejects on Content-Length before any body is read, and counts streamed
+    bytes for chunked requests, so an oversized upload is cut off early
+    instead of being spooled in full by the multipart parser first.
+    """
+
+    def __init__(self, app, limits: dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.limits:
+            return await self.app(scope, receive, send)
+
+        max_bytes = self.limits[scope["path"]]
+        limit = max_bytes + _MULTIPART_OVERHEAD
+
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    too_large = int(value) > limit
+                except ValueError:
+                    too_large = False
+                if too_large:
+                    return await _send_413(send, max_bytes)
+                break
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # HTTPException passes through FastAPI's body parsing
+                    raise UploadTooLarge(max_bytes)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+async def _send_413(send, max_bytes: int) -> None:
+    body = ('{"detail": "File too large (limit %d MB)"}' % (max_bytes // (1024 * 1024))).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 413,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"connection", b"close"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def hash_upload(file: UploadFile, max_bytes: int) -> tuple[str, int]:
+    """
+    Stream an upload in chunks, hashing as it goes.
+
+    Returns (sha256 hex digest, size) and rewinds the file so it can be read
+    again. Raises UploadTooLarge as soon as the size passes ``max_bytes``.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    await file.seek(0)
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise UploadTooLarge(max_bytes)
+        digest.update(chunk)
+    await file.seek(0)
+    return digest.hexdigest(), size
+
+
+async def save_upload(file: UploadFile, path: str, max_bytes: int) -> int:
+    """
+    Stream an upload to ``path`` in chunks.
+
+    Writes to a temporary sibling first, so an oversized upload never
+    replaces an existing file.
+    """
+    size = 0
+    tmp_path = f"{path}.part"
+    try:
+        with open(tmp_path, "wb") as f:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return size
@@ -0,0 +1,231 @@
+# backend/app/vector_index.py
+"""
+In-process nearest-neighbour index over stored embeddings.
+
+Vectors live in an append-only float32 file that is memory-mapped for
+search, with their IDs in a parallel text file, so an index survives
+restarts and grows by appending as analyses are saved. Small collections
+are searched exactly with one matrix-vector product; once a collection
+reaches VECTOR_INDEX_HNSW_THRESHOLD vectors an HNSW graph (hnswlib,
+optional dependency) is built over the same rows, persisted next to them
+and extended incrementally. Without hnswlib, search stays exact.
+
+One process should write a given index directory.
+"""
+import os
+import threading
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR") or None
+VECTOR_INDEX_HNSW_THRESHOLD = int(os.getenv("VECTOR_INDEX_HNSW_THRESHOLD", 20000))
+VECTOR_INDEX_EF_SEARCH = int(os.getenv("VECTOR_INDEX_EF_SEARCH", 64))
+
+_VECTORS_FILE = "vectors.f32"
+_IDS_FILE = "ids.txt"
+_GRAPH_FILE = "hnsw.bin"
+
+
+def _hnswlib():
+    try:
+        import hnswlib
+    except ImportError:
+        return None
+    return hnswlib
+
+
+class VectorIndex:
+    """Cosine-similarity index of unit vectors keyed by string IDs; re-adding an ID replaces it."""
+
+    def __init__(self, path: str, dims: int, hnsw_threshold: int = VECTOR_INDEX_HNSW_THRESHOLD,
+                 m: int = 16, ef_construction: int = 200, ef_search: int = VECTOR_INDEX_EF_SEARCH):
+        self.path = path
+        self.dims = dims
+        self.hnsw_threshold = hnsw_threshold
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._lock = threading.Lock()
+        self._graph = None
+        self._graph_dirty = False
+        self._map: np.memmap | None = None
+        os.makedirs(path, exist_ok=True)
+        self._load()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _load(self) -> None:
+        try:
+            with open(self._file(_IDS_FILE), "r", encoding="utf-8") as f:
+                ids = f.read().splitlines()
+        except OSError:
+            ids = []
+        try:
+            stored = os.path.getsize(self._file(_VECTORS_FILE)) // (self.dims * 4)
+        except OSError:
+            stored = 0
+        # An interrupted append can leave one file a row ahead of the other
+        rows = min(len(ids), stored)
+        self._truncate(rows, ids)
+        self._ids: list[str] = ids[:rows]
+        self._row_of: dict[str, int] = {}
+        self._stale: set[int] = set()
+        for row, vid in enumerate(self._ids):
+            if vid in self._row_of:
+                self._stale.add(self._row_of[vid])
+            self._row_of[vid] = row
+
+    def _truncate(self, rows: int, ids: list[str]) -> None:
+        try:
+            if os.path.getsize(self._file(_VECTORS_FILE)) != rows * self.dims * 4:
+                os.truncate(self._file(_VECTORS_FILE), rows * self.dims * 4)
+            if len(ids) != rows:
+                with open(self._file(_IDS_FILE), "w", encoding="utf-8") as f:
+                    f.writelines(f"{vid}\n" for vid in ids[:rows])
+        except OSError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def _matrix(self) -> np.ndarray:
+        rows = len(self._ids)
+        if self._map is None or len(self._map) != rows:
+            self._map = (np.memmap(self._file(_VECTORS_FILE), dtype="<f4", mode="r", shape=(rows, self.dims))
+                         if rows else np.zeros((0, self.dims), dtype=np.float32))
+        return self._map
+
+    def add(self, ids: list[str], vectors: np.ndarray) -> None:
+        """Append vectors (normalized here) under ``ids``."""
+        vectors = np.asarray(vectors, dtype="<f4").reshape(-1, self.dims)
+        vectors = vectors / np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+        if any("\n" in vid for vid in ids):
+            raise ValueError("vector IDs cannot contain newlines")
+        with self._lock:
+            start = len(self._ids)
+            with open(self._file(_VECTORS_FILE), "ab") as f:
+                f.write(vectors.tobytes())
+            with open(self._file(_IDS_FILE), "a", encoding="utf-8") as f:
+                f.writelines(f"{vid}\n" for vid in ids)
+            for offset, vid in enumerate(ids):
+                old = self._row_of.get(vid)
+                if old is not None:
+                    self._stale.add(old)
+                    if self._graph is not None:
+                        self._graph.mark_deleted(old)
+                self._row_of[vid] = start + offset
+            self._ids.extend(ids)
+            if self._graph is not None:
+                if self._graph.get_max_elements() < len(self._ids):
+                    self._graph.resize_index(max(len(self._ids), 2 * self._graph.get_max_elements()))
+                self._graph.add_items(vectors, np.arange(start, start + len(ids)))
+                self._graph_dirty = True
+
+    def _ensure_graph(self):
+        # Caller holds the lock
+        if self._graph is not None or len(self._ids) < self.hnsw_threshold:
+            return self._graph
+        hnswlib = _hnswlib()
+        if hnswlib is None:
+            return None
+        graph = hnswlib.Index(space="ip", dim=self.dims)
+        rows = len(self._ids)
+        matrix = self._matrix()
+        built = 0
+        try:
+            graph.load_index(self._file(_GRAPH_FILE), max_elements=rows)
+            built = min(graph.get_current_count(), rows)
+        except (OSError, RuntimeError):
+            graph.init_index(max_elements=max(rows, 1024), ef_construction=self.ef_construction, M=self.m)
+        if graph.get_max_elements() < rows:
+            graph.resize_index(rows)
+        if built < rows:
+            graph.add_items(np.asarray(matrix[built:]), np.arange(built, rows))
+        for row in self._stale:
+            try:
+                graph.mark_deleted(row)
+            except RuntimeError:
+                pass  # already marked in the saved graph
+        graph.set_ef(self.ef_search)
+        self._graph = graph
+        self._graph_dirty = built < rows
+        self.flush()
+        return graph
+
+    def flush(self) -> None:
+        """Persist the HNSW graph if it changed (vectors and IDs are written on add)."""
+        if self._graph is not None and self._graph_dirty:
+            self._graph.save_index(self._file(_GRAPH_FILE))
+            self._graph_dirty = False
+
+    def search(self, query: np.ndarray, k: int = 10, ids=None) -> list[tuple[str, float]]:
+        """
+        The ``k`` nearest IDs to ``query`` as (id, cosine similarity), best first.
+
+        ``ids`` restricts the search to those IDs (e.g. one user's rows). A
+        subset smaller than the HNSW threshold is searched exactly; a larger
+        one walks the graph with a filter, so it still returns k of its own.
+        """
+        query = np.asarray(query, dtype=np.float32).reshape(self.dims)
+        query = query / (np.linalg.norm(query) or 1.0)
+        with self._lock:
+            if ids is not None:
+                rows = np.fromiter(
+                    (r for r in (self._row_of.get(str(vid)) for vid in ids) if r is not None), dtype=np.int64
+                )
+                rows.sort()
+            k = min(k, len(self) if ids is None else len(rows))
+            if k <= 0:
+                return []
+            graph = self._ensure_graph() if ids is None or len(rows) >= self.hnsw_threshold else None
+            if graph is not None:
+                if ids is None:
+                    labels, distances = graph.knn_query(query, k=k)
+                else:
+                    allowed = set(rows.tolist())
+                    labels, distances = graph.knn_query(query, k=k, filter=allowed.__contains__)
+                # "ip" distance is 1 - inner product
+                return [(self._ids[r], float(1.0 - d)) for r, d in zip(labels[0], distances[0])]
+            matrix = self._matrix()
+            id_list = self._ids
+            stale = self._stale
+        if ids is None:
+            sims = np.asarray(matrix @ query)
+            if stale:
+                sims = sims.copy()
+                sims[list(stale)] = -np.inf
+        else:
+            # _row_of only points at live rows, so there is nothing stale here
+            sims = np.asarray(matrix[rows] @ query)
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top], kind="stable")]
+        if ids is not None:
+            return [(id_list[rows[r]], float(sims[r])) for r in top]
+        return [(id_list[r], float(sims[r])) for r in top]
+
+
+_indexes: dict[str, VectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_vector_index(name: str, dims: int) -> VectorIndex | None:
+    """The named index under VECTOR_INDEX_DIR (None when not configured)."""
+    if not VECTOR_INDEX_DIR:
+        return None
+    index = _indexes.get(name)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(name)
+            if index is None:
+                index = _indexes[name] = VectorIndex(os.path.join(VECTOR_INDEX_DIR, name), dims)
+    return index
+
+
+def flush_vector_indexes() -> None:
+    for index in list(_indexes.values()):
+        with index._lock:
+            index.flush()
@@ -0,0 +1,222 @@
+# backend/app/workers.py
+
+import multiprocessing
+import os
+import queue
+import threading
+
+from dotenv import load_dotenv
+
+from .taxonomy import get_taxonomy
+
+load_dotenv()
+
+PARSER_WORKERS = int(os.getenv("PARSER_WORKERS", min(4, os.cpu_count() or 1)))
+PARSER_TIMEOUT = float(os.getenv("PARSER_TIMEOUT", 20))
+PARSER_MEMORY_MB = int(os.getenv("PARSER_MEMORY_MB", 512))
+PARSER_STARTUP_TIMEOUT = float(os.getenv("PARSER_STARTUP_TIMEOUT", 120))
+
+
+class ParseTimeout(Exception):
+    """A document took longer than the per-document wall-clock limit."""
+
+
+class ParseMemoryError(Exception):
+    """A document pushed its worker past the per-document memory cap."""
+
+
+class ParserPoolBusy(Exception):
+    """No worker became free in time; the caller should retry later."""
+
+
+def _virtual_memory_bytes() -> int | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmSize:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _apply_memory_limit(memory_mb: int) -> None:
+    """Cap the worker's address space at its warmed-up size + memory_mb."""
+    if memory_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    baseline = _virtual_memory_bytes() or 0
+    limit = baseline + memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError) as e:
+        print(f"Parser worker could not set memory limit: {e}")
+
+
+def _worker_main(conn, memory_mb: int) -> None:
+    """Worker process loop: receive PDF bytes, send back parse results."""
+    from .parser import parse_resume, get_nlp
+    from .taxonomy import ensure_taxonomy
+
+    # Load models before accepting work so they don't count against the
+    # first document's timeout or memory cap.
+    try:
+        get_nlp("ner")
+    except Exception as e:
+        print(f"Parser worker failed to preload spaCy: {e}")
+    _apply_memory_limit(memory_mb)
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+        content, taxonomy_version = job
+        # Follow taxonomy hot reloads in the parent process
+        ensure_taxonomy(taxonomy_version)
+        try:
+            conn.send(("ok", parse_resume(content)))
+        except MemoryError:
+            conn.send(("memory", "Document exceeded the parser memory limit"))
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+
+class _Worker:
+    def __init__(self, ctx, memory_mb: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, memory_mb), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+
+    def wait_ready(self, timeout: float) -> None:
+        if self.ready:
+            return
+        if not self.conn.poll(timeout):
+            raise RuntimeError("Parser worker did not start in time")
+        kind, _ = self.conn.recv()
+        if kind != "ready":
+            raise RuntimeError(f"Unexpected parser worker message: {kind}")
+        self.ready = True
+
+    def kill(self) -> None:
+        try:
+            self.process.kill()
+            self.process.join(timeout=5)
+        except Exception:
+            pass
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+            self.process.join(timeout=2)
+        except Exception:
+            pass
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+class ParserPool:
+    """
+    Fixed-size pool of parser processes with per-document limits.
+
+    Each call checks out one idle worker, so at most ``size`` documents are
+    parsed at once. A worker that exceeds ``timeout`` is killed and replaced;
+    a worker that dies (e.g. over its memory cap) is replaced as well.
+    """
+
+    def __init__(
+        self,
+        size: int = PARSER_WORKERS,
+        timeout: float = PARSER_TIMEOUT,
+        memory_mb: int = PARSER_MEMORY_MB,
+    ):
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self.restarts = 0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            for _ in range(self.size):
+                self._idle.put(_Worker(self._ctx, self.memory_mb))
+            self._started = True
+
+    def shutdown(self) -> None:
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().stop()
+                except queue.Empty:
+                    break
+            self._started = False
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        self.restarts += 1
+        self._idle.put(_Worker(self._ctx, self.memory_mb))
+
+    def parse(self, content: bytes, wait: float | None = None) -> dict:
+        """Parse one document in a worker process (blocking)."""
+        self.start()
+        try:
+            worker = self._idle.get(timeout=wait if wait is not None else self.timeout)
+        except queue.Empty:
+            raise ParserPoolBusy("All parser workers are busy")
+
+        try:
+            worker.wait_ready(PARSER_STARTUP_TIMEOUT)
+        except (EOFError, OSError, RuntimeError) as e:
+            print(f"Parser worker failed to start: {e}")
+            self._replace(worker)
+            raise ParserPoolBusy("Parser worker is restarting")
+
+        try:
+            worker.conn.send((content, get_taxonomy().version))
+            if not worker.conn.poll(self.timeout):
+                print("Parser worker timed out; restarting it")
+                self._replace(worker)
+                raise ParseTimeout(f"Parsing exceeded {self.timeout:g}s")
+            kind, payload = worker.conn.recv()
+        except (EOFError, OSError):
+            # Worker died mid-document: most likely killed for memory use
+            self._replace(worker)
+            raise ParseMemoryError("Parser worker crashed while processing the document")
+
+        if kind == "memory":
+            # Heap may be fragmented after a MemoryError; start fresh
+            self._replace(worker)
+            raise ParseMemoryError(payload)
+
+        self._idle.put(worker)
+        if kind == "error":
+            raise ValueError(payload)
+        return payload
+
+
+_parser_pool = None
+
+
+def get_parser_pool() -> ParserPool:
+    global _parser_pool
+    if _parser_pool is None:
+        _parser_pool = ParserPool()
+    return _parser_pool
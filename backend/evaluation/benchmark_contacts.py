@@ -0,0 +1,128 @@
+"""
+Adversarial-input benchmark for contact extraction.
+
+Feeds extract_contacts inputs that made the old per-call regexes backtrack
+(long digit/space runs from PDF tables, long address-character runs with no
+"@", chains of "@"), checks the results match the legacy implementation on
+random fuzz input, checks parse_resume's header-then-full-text contact
+lookup on a few resume layouts, and fails if any input exceeds the time
+ceiling per KB.
+
+Usage (from backend/):
+    python evaluation/benchmark_contacts.py [--kb 64] [--ceiling-ms-per-kb 1.0]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.parser import extract_contacts, resume_contacts  # noqa: E402
+from app.sections import segment_sections  # noqa: E402
+
+
+def legacy_extract_contacts(text):
+    """The original implementation, kept for parity checks."""
+    emails = re.findall(r"[a-zA-Z0-9+._%-]+@[a-zA-Z0-9._%-]+\.[a-zA-Z]{2,}", text)
+    phones_raw = re.findall(r"\+?\d[\d\s\-()]{7,}\d", text)
+    phones_cleaned = []
+    for p in phones_raw:
+        digits_only = re.sub(r"[^\d+]", "", p)
+        digit_count = len(re.sub(r"[^\d]", "", digits_only))
+        if 10 <= digit_count <= 14:
+            phones_cleaned.append(digits_only)
+    return list(dict.fromkeys(emails)), list(dict.fromkeys(phones_cleaned))
+
+
+def adversarial_inputs(n_bytes):
+    rng = random.Random(3)
+    table_row = "2019 2020 2021 3.5 4.0 (12) 15-20 "
+    return {
+        "digits": "5" * n_bytes,
+        "digit-space": "1 " * (n_bytes // 2),
+        "pdf-table": (table_row * (n_bytes // len(table_row) + 1))[:n_bytes],
+        "no-at-local": "a.b-c_" * (n_bytes // 6),
+        "at-chain": "x@" * (n_bytes // 2),
+        "dotted-domain": "a@" + "b." * (n_bytes // 2),
+        "random": "".join(rng.choice("0123456789 -()+@.ab\n") for _ in range(n_bytes)),
+    }
+
+
+def fuzz_parity(rounds=20000):
+    rng = random.Random(11)
+    alphabets = ["ab1234567890 -()+@.x_%\n", "123 456 7890 +()-@ab.cd\n", "9@.xy -"]
+    for i in range(rounds):
+        text = "".join(rng.choice(alphabets[i % 3]) for _ in range(rng.randint(1, 80)))
+        expected = legacy_extract_contacts(text)
+        actual = extract_contacts(text)
+        assert actual == expected, f"Mismatch on {text!r}:\n legacy={expected}\n new   ={actual}"
+    print(f"Fuzz parity passed ({rounds} random inputs).")
+
+
+# (resume text, expected (emails, phones)) for the section-scoped lookup in
+# parse_resume: a field missing from the header falls back to the full text
+SECTION_CASES = [
+    # Email under the name, phone in a trailing sidebar line
+    ("Jane Doe\njane.doe@mail.com\n\nEXPERIENCE\nBackend engineer at Acme, 2019-2023\n\n"
+     "SKILLS\nPython, SQL\n\nPhone: +91 98765 43210\n",
+     (["jane.doe@mail.com"], ["+919876543210"])),
+    # Phone under the name, email in the sidebar
+    ("Jane Doe\n+91 98765 43210\n\nEXPERIENCE\nBackend engineer at Acme\n\nSKILLS\nPython\n\n"
+     "jane.doe@mail.com\n",
+     (["jane.doe@mail.com"], ["+919876543210"])),
+    # Both in the header: a referee's number further down is not picked up
+    ("Jane Doe\njane.doe@mail.com | +91 98765 43210\n\nEXPERIENCE\nBackend engineer\n\n"
+     "REFERENCES\nJohn Roe, +1 555 123 4567, john@acme.com\n",
+     (["jane.doe@mail.com"], ["+919876543210"])),
+]
+
+
+def section_checks():
+    for text, expected in SECTION_CASES:
+        actual = resume_contacts(text, segment_sections(text))
+        assert actual == expected, f"Mismatch on {text!r}:\n expected={expected}\n got     ={actual}"
+    print(f"Section fallback checks passed ({len(SECTION_CASES)} resumes).")
+
+
+def time_ms(fn, text, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--kb", type=int, default=64)
+    ap.add_argument("--ceiling-ms-per-kb", type=float, default=1.0)
+    ap.add_argument("--legacy-kb", type=int, default=8,
+                    help="input size for the (quadratic) legacy comparison")
+    args = ap.parse_args()
+
+    fuzz_parity()
+    section_checks()
+
+    print(f"\n{'input':>14} {'new ms/KB':>10} {'legacy ms/KB':>13}")
+    failures = []
+    big = adversarial_inputs(args.kb * 1024)
+    small = adversarial_inputs(args.legacy_kb * 1024)
+    for name, text in big.items():
+        per_kb = time_ms(extract_contacts, text) / args.kb
+        legacy_per_kb = time_ms(legacy_extract_contacts, small[name], repeat=1) / args.legacy_kb
+        print(f"{name:>14} {per_kb:10.4f} {legacy_per_kb:13.4f}")
+        if per_kb > args.ceiling_ms_per_kb:
+            failures.append(name)
+
+    if failures:
+        print(f"\nFAIL: over {args.ceiling_ms_per_kb} ms/KB: {', '.join(failures)}")
+        sys.exit(1)
+    print(f"\nAll inputs under {args.ceiling_ms_per_kb} ms/KB.")
+
+
+if __name__ == "__main__":
+    main()
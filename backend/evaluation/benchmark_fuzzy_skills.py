@@ -0,0 +1,91 @@
+"""
+Fuzzy skill normalization benchmark.
+
+Times the optional embedding stage (app.fuzzy_skills) per resume with the
+real SBERT model: cold index build, index load from the disk cache, and the
+steady-state per-resume cost (candidate extraction + one batched encode +
+one matrix multiply). Also prints what the stage recovered.
+
+Usage (from backend/):
+    python evaluation/benchmark_fuzzy_skills.py [--docs 200]
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app import fuzzy_skills  # noqa: E402
+from app.embeddings import get_sbert_model  # noqa: E402
+from app.sections import segment_sections  # noqa: E402
+from app.taxonomy import get_taxonomy  # noqa: E402
+
+UNSEEN = [
+    "Postgres", "PyTorch Lightning", "AWS Lambda functions", "Kubernetess", "ReactJS",
+    "Scikit Learn", "Google BigQuery", "Tailwind", "GitHub Actions", "Node",
+    "TensorFlow 2", "Spring Boot", "MS SQL Server", "Hugging Face", "Amazon S3",
+]
+KNOWN = ["Python", "Docker", "SQL", "Java", "Git", "Linux", "AWS", "React"]
+
+
+def make_resumes(n, seed=11):
+    rng = random.Random(seed)
+    docs = []
+    for i in range(n):
+        skills = rng.sample(UNSEEN, 5) + rng.sample(KNOWN, 4)
+        rng.shuffle(skills)
+        docs.append(
+            f"Candidate {i}\nSummary\nBackend engineer with six years of experience.\n"
+            f"Skills\n{', '.join(skills)}\n"
+            "Experience\nBuilt data pipelines and services for a fintech company.\n"
+        )
+    return docs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--docs", type=int, default=200)
+    args = ap.parse_args()
+
+    if get_sbert_model() is None:
+        sys.exit("SBERT model not available")
+    taxonomy = get_taxonomy()
+    cache_dir = tempfile.mkdtemp(prefix="skill_embeddings_")
+    try:
+        start = time.perf_counter()
+        fuzzy_skills.SkillEmbeddingIndex.build(taxonomy, cache_dir)
+        build_s = time.perf_counter() - start
+        start = time.perf_counter()
+        index = fuzzy_skills.SkillEmbeddingIndex.build(taxonomy, cache_dir)
+        load_s = time.perf_counter() - start
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    fuzzy_skills._index = index
+    print(f"Index: {len(index.terms)} terms x {index.matrix.shape[1]} dims")
+    print(f"  cold build {build_s * 1000:.0f} ms, load from disk {load_s * 1000:.1f} ms")
+
+    docs = make_resumes(args.docs)
+    timings = []
+    recovered = {}
+    for text in docs:
+        start = time.perf_counter()
+        phrases = fuzzy_skills.candidate_phrases(text, segment_sections(text), taxonomy)
+        matches = fuzzy_skills.fuzzy_match(phrases, taxonomy)
+        timings.append(time.perf_counter() - start)
+        for m in matches:
+            recovered[m["term"]] = (m["skill"], m["score"])
+
+    timings.sort()
+    print(f"Per resume ({args.docs} docs): p50 {timings[len(timings) // 2] * 1000:.2f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95)] * 1000:.2f} ms")
+    print(f"Recovered (threshold {fuzzy_skills.FUZZY_SKILL_THRESHOLD}):")
+    for term, (skill, score) in sorted(recovered.items()):
+        print(f"  {term:<22} -> {skill:<20} {score:.3f}")
+
+
+if __name__ == "__main__":
+    main()
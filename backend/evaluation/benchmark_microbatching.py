@@ -0,0 +1,80 @@
+"""
+SBERT micro-batching benchmark.
+
+Simulates concurrent /score traffic: N threads each embed a distinct
+resume/JD pair (embedding cache disabled) with and without the
+MicroBatcher, and reports throughput, p50/p95 latency and the batch sizes
+the scheduler formed.
+
+Usage (from backend/):
+    python evaluation/benchmark_microbatching.py [--threads 16] [--requests 400] [--wait-ms 2]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app import embeddings  # noqa: E402
+from app.batching import MicroBatcher  # noqa: E402
+
+RESUME = "Backend engineer: Python, Django, PostgreSQL, AWS, Docker, Kubernetes. Request {}. " * 3
+JD = "Hiring a backend engineer with Python and cloud experience. Opening {}. " * 2
+
+
+def run(threads, requests, wait_ms):
+    embeddings.SBERT_BATCH_WAIT_MS = wait_ms
+    embeddings.encode_batcher = MicroBatcher(embeddings._encode_batch, embeddings.SBERT_BATCH_SIZE, wait_ms)
+    embeddings.embedding_cache.max_bytes = 0  # every request pays for its encode
+    latencies = []
+    lock = threading.Lock()
+    counter = iter(range(requests))
+
+    def worker():
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            start = time.perf_counter()
+            embeddings.encode_texts([RESUME.format(i), JD.format(i)])
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "mean_batch": embeddings.encode_batcher.stats()["batch_size"]["mean"] if wait_ms > 0 else 2.0,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--threads", type=int, default=16)
+    ap.add_argument("--requests", type=int, default=400)
+    ap.add_argument("--wait-ms", type=float, default=2.0)
+    args = ap.parse_args()
+
+    if embeddings.get_sbert_model() is None:
+        sys.exit("SBERT model not available")
+    embeddings.encode_texts(["warm up"])
+
+    print(f"{'mode':>12} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'mean batch':>11}")
+    for label, wait_ms in (("per-call", 0.0), ("batched", args.wait_ms)):
+        r = run(args.threads, args.requests, wait_ms)
+        print(f"{label:>12} {r['rps']:>8.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['mean_batch']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Name extraction benchmark: full spaCy pipeline vs NER-only slim pipeline.
+
+Each configuration runs in a fresh subprocess so peak RSS reflects only the
+model it loads. Reports load time, peak RSS and throughput for:
+  - full pipeline, one nlp() call per resume (the previous extract_name path)
+  - NER-only pipeline, one call per resume (extract_name)
+  - NER-only pipeline, batched through nlp.pipe (extract_names)
+
+Usage (from backend/):
+    python evaluation/benchmark_name_extraction.py [--docs 2000]
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+FIRST = ["Priya", "John", "Maria", "Wei", "Ahmed", "Olivia", "Carlos", "Aisha", "Liam", "Yuki"]
+LAST = ["Sharma", "Smith", "Garcia", "Chen", "Khan", "Brown", "Lopez", "Okafor", "Murphy", "Sato"]
+
+
+def make_headers(n, seed=7):
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(n):
+        name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+        docs.append(
+            f"{name}\nSenior Software Engineer | {name.split()[0].lower()}@example.com | +1 555 010 {rng.randint(1000, 9999)}\n"
+            "Summary: Backend engineer with experience in Python, Django, PostgreSQL and AWS. "
+            "Led migration of monolith to microservices on Kubernetes, reducing latency by 40%. "
+            "Experience: Acme Corp (2019-2024) - built data pipelines with Kafka and Spark. "
+            "Education: B.Tech Computer Science, 2018.\n" * 2
+        )
+    return docs
+
+
+def run_child(mode, n_docs):
+    sys.path.insert(0, BACKEND_DIR)
+    from app import parser
+
+    docs = make_headers(n_docs)
+    start = time.perf_counter()
+    nlp = parser.get_nlp("full" if mode == "full" else "ner")
+    load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if mode == "ner-batch":
+        names = parser.extract_names(docs)
+    else:
+        names = [parser._first_person(nlp(d[:parser.NAME_WINDOW])) for d in docs]
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        "mode": mode,
+        "pipeline": nlp.pipe_names,
+        "load_s": load_s,
+        "docs_per_s": n_docs / elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "found": sum(1 for n in names if n),
+    }))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--docs", type=int, default=2000)
+    ap.add_argument("--child", choices=["full", "ner", "ner-batch"])
+    args = ap.parse_args()
+
+    if args.child:
+        run_child(args.child, args.docs)
+        return
+
+    print(f"{'mode':>10} {'load s':>7} {'docs/s':>8} {'peak RSS MB':>12} {'names':>6}  pipeline")
+    for mode in ("full", "ner", "ner-batch"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", mode, "--docs", str(args.docs)],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip().splitlines()[-1]
+        r = json.loads(out)
+        print(
+            f"{r['mode']:>10} {r['load_s']:7.2f} {r['docs_per_s']:8.1f} "
+            f"{r['peak_rss_mb']:12.1f} {r['found']:6d}  {','.join(r['pipeline'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
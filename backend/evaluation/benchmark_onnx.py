@@ -0,0 +1,87 @@
+"""
+SBERT backend benchmark: PyTorch vs ONNX Runtime (fp32 and int8).
+
+Each backend runs in a fresh subprocess so peak RSS includes its imports
+(torch for the PyTorch path). Reports load time, peak RSS, single-pair
+latency (the /score path) and batched throughput.
+
+Usage (from backend/, after `python -m app.onnx_encoder export -o onnx_model --quantize`):
+    python evaluation/benchmark_onnx.py --onnx-dir onnx_model [--pairs 50]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+RESUME = ("Backend engineer with eight years of experience in Python, Django, PostgreSQL and AWS. "
+          "Led the migration of a monolith to microservices on Kubernetes. ") * 6
+JD = "Hiring a senior backend engineer: Python, Django, Docker, Kubernetes, AWS, CI/CD. " * 3
+
+
+def run_child(backend, onnx_dir, pairs):
+    sys.path.insert(0, BACKEND_DIR)
+    start = time.perf_counter()
+    if backend == "torch":
+        from sentence_transformers import SentenceTransformer
+        from app.embeddings import SBERT_MODEL_NAME
+
+        model = SentenceTransformer(SBERT_MODEL_NAME, device="cpu")
+    else:
+        from app.onnx_encoder import OnnxSentenceEncoder
+
+        model = OnnxSentenceEncoder(onnx_dir, quantized=backend == "onnx-int8")
+    model.encode([RESUME, JD], normalize_embeddings=True)
+    load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(pairs):
+        model.encode([RESUME, JD], normalize_embeddings=True)
+    pair_ms = (time.perf_counter() - start) / pairs * 1000
+
+    batch = [RESUME[i:] + JD for i in range(64)]
+    start = time.perf_counter()
+    model.encode(batch, batch_size=32, normalize_embeddings=True)
+    batch_s = time.perf_counter() - start
+
+    print(json.dumps({
+        "backend": backend,
+        "load_s": load_s,
+        "pair_ms": pair_ms,
+        "texts_per_s": len(batch) / batch_s,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--onnx-dir", default="onnx_model")
+    ap.add_argument("--pairs", type=int, default=50)
+    ap.add_argument("--child", choices=["torch", "onnx", "onnx-int8"])
+    args = ap.parse_args()
+
+    if args.child:
+        run_child(args.child, args.onnx_dir, args.pairs)
+        return
+
+    print(f"{'backend':>10} {'load s':>7} {'pair ms':>8} {'texts/s':>8} {'peak RSS MB':>12}")
+    for backend in ("torch", "onnx", "onnx-int8"):
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", backend, "--onnx-dir", args.onnx_dir,
+             "--pairs", str(args.pairs)],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{backend:>10} failed: {proc.stderr.strip().splitlines()[-1:]}")
+            continue
+        r = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(f"{r['backend']:>10} {r['load_s']:>7.2f} {r['pair_ms']:>8.1f} "
+              f"{r['texts_per_s']:>8.1f} {r['peak_rss_mb']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
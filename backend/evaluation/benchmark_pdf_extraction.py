@@ -0,0 +1,102 @@
+"""
+PDF extraction benchmark: temp-file round trip vs in-memory BytesIO vs the
+page/char-bounded streaming extractor used by parse_resume.
+
+Runs the paths over a corpus of PDFs, checks the unbounded ones produce the
+same text and reports mean/p95 latency per document.
+
+Usage (from backend/):
+    python evaluation/benchmark_pdf_extraction.py [pdf_dir] [--repeat N]
+        [--max-pages N] [--max-chars N]
+
+pdf_dir defaults to backend/ (which ships a few sample resumes/reports).
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from pdfminer.high_level import extract_text
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.parser import extract_text_bounded  # noqa: E402
+
+
+def extract_via_tempfile(content):
+    """The original implementation: write to disk, let pdfminer reopen it."""
+    with NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
+        tmp.write(content)
+        tmp_path = tmp.name
+    try:
+        return extract_text(tmp_path) or ""
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
+def extract_in_memory(content):
+    return extract_text(BytesIO(content)) or ""
+
+
+def p95(values):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+
+def run(fn, corpus, repeat):
+    timings = []
+    for _ in range(repeat):
+        for content in corpus.values():
+            start = time.perf_counter()
+            fn(content)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    default_dir = os.path.join(os.path.dirname(__file__), "..")
+    ap = argparse.ArgumentParser()
+    ap.add_argument("pdf_dir", nargs="?", default=default_dir)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--max-pages", type=int, default=4)
+    ap.add_argument("--max-chars", type=int, default=20000)
+    args = ap.parse_args()
+
+    def extract_bounded(content):
+        return extract_text_bounded(BytesIO(content), args.max_pages, args.max_chars)[0]
+
+    paths = sorted(glob.glob(os.path.join(args.pdf_dir, "*.pdf")))
+    if not paths:
+        print(f"No PDFs found in {args.pdf_dir}")
+        return
+    corpus = {p: Path(p).read_bytes() for p in paths}
+    total_kb = sum(len(c) for c in corpus.values()) / 1024
+    print(f"Corpus: {len(corpus)} PDFs, {total_kb:.0f} KB")
+
+    for path, content in corpus.items():
+        if extract_via_tempfile(content) != extract_in_memory(content):
+            print(f"WARNING: text differs for {os.path.basename(path)}")
+
+    # Warmup (pdfminer caches font metrics / CMaps on first use)
+    run(extract_in_memory, corpus, 1)
+
+    extractors = (
+        ("temp file", extract_via_tempfile),
+        ("in-memory", extract_in_memory),
+        ("bounded", extract_bounded),
+    )
+    for label, fn in extractors:
+        timings = run(fn, corpus, args.repeat)
+        print(
+            f"{label:>10}: mean {statistics.mean(timings) * 1000:7.2f} ms/doc, "
+            f"p95 {p95(timings) * 1000:7.2f} ms/doc"
+        )
+
+
+if __name__ == "__main__":
+    main()
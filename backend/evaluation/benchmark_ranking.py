@@ -0,0 +1,77 @@
+"""
+Resume pool ranking benchmark.
+
+Ranks synthetic pools of increasing size against one JD with
+app.ranking.ResumePool (one matrix-vector product + vectorized coverage)
+and, for the smallest pool, with one compute_score call per resume (the
+per-pair path). Embeddings are random unit vectors of the SBERT width, so
+the SBERT model is only used for the single JD encode in each rank call.
+
+Usage (from backend/):
+    python evaluation/benchmark_ranking.py [--sizes 1000 5000 20000] [--k 10]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app.ranking import ResumePool  # noqa: E402
+from app.scoring import compute_score  # noqa: E402
+from app.taxonomy import get_taxonomy  # noqa: E402
+
+DIMS = 384
+JD = (
+    "We are hiring a backend engineer to build APIs in Python and Django on AWS. "
+    "Experience with PostgreSQL, Docker, Kubernetes and CI/CD is required; "
+    "Kafka and Redis are a plus. You will work with frontend engineers using React. "
+) * 3
+
+
+def make_pool(n, seed=5):
+    rng = random.Random(seed)
+    skills = list(get_taxonomy().skills)
+    embeddings = np.random.default_rng(seed).standard_normal((n, DIMS)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return ResumePool(
+        [f"resume-{i}" for i in range(n)],
+        [rng.sample(skills, rng.randint(5, 25)) for _ in range(n)],
+        embeddings,
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--pairwise", type=int, default=200,
+                    help="resumes to score one pair at a time for comparison")
+    args = ap.parse_args()
+
+    pool = make_pool(max(args.sizes))
+    pool.rank(JD, args.k)  # load model, pack masks
+
+    print(f"{'pool size':>10} {'rank ms':>9} {'us/resume':>10}")
+    for n in args.sizes:
+        sub = ResumePool(pool.ids[:n], pool.skills[:n], pool.embeddings[:n])
+        sub.rank(JD, args.k)
+        start = time.perf_counter()
+        sub.rank(JD, args.k)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>10} {elapsed * 1000:>9.1f} {elapsed / n * 1e6:>10.2f}")
+
+    texts = [" ".join(s) for s in pool.skills[:args.pairwise]]
+    start = time.perf_counter()
+    for text, skills in zip(texts, pool.skills):
+        compute_score(text, JD, skills)
+    per_pair = (time.perf_counter() - start) / len(texts)
+    print(f"Per-pair compute_score: {per_pair * 1000:.1f} ms/resume "
+          f"(~{per_pair * max(args.sizes):.0f}s for {max(args.sizes)} resumes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Skill matcher benchmark.
+
+Compares the legacy per-skill regex scan against the single-pass PhraseMatcher
+used by app.parser.extract_skills, first on the shipped taxonomy (with a parity
+check) and then on synthetic taxonomies of increasing size.
+
+Usage (from backend/):
+    python evaluation/benchmark_skill_matcher.py
+"""
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.matcher import PhraseMatcher  # noqa: E402
+from app.skills import SKILLS, SYNONYMS  # noqa: E402
+
+SAMPLE_RESUME = """
+John Doe - Senior Software Engineer
+Summary: Backend engineer with 6 years of Python, Go and Node.js experience.
+Skills: Python, Django, FastAPI, React Native, PostgreSQL, Redis, Kafka, Docker,
+K8s, Terraform, AWS (EC2, S3, Lambda), Google Cloud, CI/CD, GitHub Actions, REST.
+Experience: Built microservices on Kubernetes; led migration from MySQL to
+PostgreSQL; designed gRPC APIs; ML pipelines with scikit-learn and PyTorch.
+"""
+
+
+def legacy_extract(text, skills, synonyms):
+    """The original implementation: one regex per skill and per synonym."""
+    text_low = text.lower()
+    found = set()
+    for skill in sorted(skills, key=len, reverse=True):
+        s_esc = re.escape(skill.lower())
+        pattern = r'(?:^|[\s,.\/;:\(\)\[\]])' + s_esc + r'(?:$|[\s,.\/;:\(\)\[\]])'
+        if re.search(pattern, text_low):
+            found.add(skill)
+    for syn, real in synonyms.items():
+        s_esc = re.escape(syn)
+        pattern = r'(?:^|[\s,.\/;:\(\)\[\]])' + s_esc + r'(?:$|[\s,.\/;:\(\)\[\]])'
+        if re.search(pattern, text_low):
+            found.add(real)
+    return sorted(found)
+
+
+def build_matcher(skills, synonyms):
+    phrases = {}
+    for skill in skills:
+        phrases.setdefault(skill.lower(), set()).add(skill)
+    for syn, real in synonyms.items():
+        phrases.setdefault(syn.lower(), set()).add(real)
+    return PhraseMatcher(phrases)
+
+
+def time_call(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def synthetic_taxonomy(size, rng):
+    alphabet = "abcdefghijklmnopqrstuvwxyz"
+    skills = set(s.lower() for s in SKILLS)
+    while len(skills) < size:
+        words = rng.randint(1, 3)
+        skills.add(" ".join(
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 9)))
+            for _ in range(words)
+        ))
+    return sorted(skills)
+
+
+def synthetic_text(skills, n_chars, rng):
+    words = []
+    length = 0
+    filler = ["built", "led", "team", "with", "and", "the", "using", "scaled"]
+    while length < n_chars:
+        token = rng.choice(skills) if rng.random() < 0.15 else rng.choice(filler)
+        words.append(token + rng.choice([" ", ", ", ". ", "\n"]))
+        length += len(words[-1])
+    return "".join(words)
+
+
+def check_parity(matcher):
+    texts = [
+        SAMPLE_RESUME,
+        "c++ c# .net asp.net node.js react.js google cloud amazon web services",
+        "rest api, restful api; ci-cd (gitlab-ci) [k8s] sql server/ms sql",
+        "python3 javascripting reactive c+ excel.",
+    ]
+    for text in texts:
+        expected = legacy_extract(text, SKILLS, SYNONYMS)
+        actual = sorted(matcher.find(text.lower()))
+        assert actual == expected, f"Mismatch:\n legacy={expected}\n new   ={actual}"
+    print(f"Parity check passed on {len(texts)} samples.")
+
+
+def main():
+    rng = random.Random(42)
+
+    print("--- Shipped taxonomy ---")
+    start = time.perf_counter()
+    matcher = build_matcher(SKILLS, SYNONYMS)
+    print(f"Compile time: {(time.perf_counter() - start) * 1000:.2f} ms ({len(matcher)} phrases)")
+    check_parity(matcher)
+
+    legacy = time_call(lambda: legacy_extract(SAMPLE_RESUME, SKILLS, SYNONYMS), 50)
+    single = time_call(lambda: matcher.find(SAMPLE_RESUME.lower()), 500)
+    print(f"Legacy per-skill scan: {legacy * 1000:.3f} ms/resume")
+    print(f"Single-pass matcher:   {single * 1000:.3f} ms/resume ({legacy / single:.1f}x faster)")
+
+    print("\n--- Synthetic taxonomies (20k-char resume) ---")
+    print(f"{'skills':>8} {'compile ms':>11} {'legacy ms':>10} {'matcher ms':>11}")
+    for size in (1_000, 10_000, 50_000):
+        skills = synthetic_taxonomy(size, rng)
+        text = synthetic_text(skills, 20_000, rng)
+
+        start = time.perf_counter()
+        big = build_matcher(skills, {})
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        single = time_call(lambda: big.find(text.lower()), 20)
+        if size <= 10_000:
+            legacy = time_call(lambda: legacy_extract(text, skills, {}), 1)
+            legacy_col = f"{legacy * 1000:10.1f}"
+        else:
+            legacy_col = f"{'skipped':>10}"
+        print(f"{size:>8} {compile_ms:11.1f} {legacy_col} {single * 1000:11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Vector index benchmark: exact (memory-mapped brute force) vs HNSW.
+
+For each collection size, fills an app.vector_index.VectorIndex with
+clustered synthetic unit vectors (SBERT width), then for a fixed query set
+reports exact search latency and, for HNSW (needs hnswlib), build time plus
+recall@k and latency at several ef values. Ground truth is the exact
+search. 1M x 384 vectors take ~1.5 GB on disk and the HNSW build takes
+several minutes.
+
+Usage (from backend/):
+    python evaluation/benchmark_vector_index.py [--sizes 10000 100000 1000000] [--queries 200]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app.vector_index import VectorIndex, _hnswlib  # noqa: E402
+
+DIMS = 384
+EF_VALUES = (16, 32, 64, 128, 256)
+
+
+def clustered(n, rng, centers):
+    labels = rng.integers(0, len(centers), n)
+    x = centers[labels] + 0.35 * rng.standard_normal((n, DIMS)).astype(np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def fill(index, n, rng, centers, chunk=50000):
+    for start in range(0, n, chunk):
+        size = min(chunk, n - start)
+        index.add([str(i) for i in range(start, start + size)], clustered(size, rng, centers))
+
+
+def timed_search(index, queries, k):
+    start = time.perf_counter()
+    results = [index.search(q, k) for q in queries]
+    return results, (time.perf_counter() - start) / len(queries) * 1000
+
+
+def recall(results, truth):
+    hits = sum(len({i for i, _ in r} & {i for i, _ in t}) for r, t in zip(results, truth))
+    return hits / sum(len(t) for t in truth)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("-k", type=int, default=10)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(42)
+    centers = rng.standard_normal((256, DIMS)).astype(np.float32)
+    queries = clustered(args.queries, rng, centers)
+    has_hnsw = _hnswlib() is not None
+    if not has_hnsw:
+        print("hnswlib not installed: reporting exact search only (pip install hnswlib)")
+
+    print(f"{'size':>9} {'method':>12} {'build s':>8} {'recall@k':>9} {'ms/query':>9}")
+    for n in args.sizes:
+        workdir = tempfile.mkdtemp(prefix="vector_index_")
+        try:
+            exact = VectorIndex(workdir, DIMS, hnsw_threshold=n + 1)
+            fill(exact, n, rng, centers)
+            truth, ms = timed_search(exact, queries, args.k)
+            print(f"{n:>9} {'exact':>12} {'-':>8} {1.0:>9.3f} {ms:>9.2f}")
+            if not has_hnsw:
+                continue
+
+            graph = VectorIndex(workdir, DIMS, hnsw_threshold=1)
+            start = time.perf_counter()
+            graph.search(queries[0], args.k)  # builds and saves the graph
+            build_s = time.perf_counter() - start
+            for ef in EF_VALUES:
+                graph._graph.set_ef(max(ef, args.k))
+                results, ms = timed_search(graph, queries, args.k)
+                print(f"{n:>9} {f'hnsw ef={ef}':>12} {build_s:>8.1f} {recall(results, truth):>9.3f} {ms:>9.2f}")
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
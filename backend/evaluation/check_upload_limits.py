@@ -0,0 +1,73 @@
+"""
+Upload size limit check: oversized uploads get a 413 a browser can read.
+
+Sends cross-origin requests straight to the ASGI app (no server needed):
+one rejected on its Content-Length header and one chunked body that runs
+past the limit while streaming. Each must come back 413 with the CORS
+headers, or the frontend sees an opaque network error instead of
+"File too large".
+
+Usage (from backend/):
+    python evaluation/check_upload_limits.py
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app.main import app  # noqa: E402
+from app.uploads import MAX_RESUME_BYTES, UPLOAD_CHUNK_SIZE  # noqa: E402
+
+ORIGIN = b"http://localhost:5173"
+PART_HEADER = (b'--x\r\nContent-Disposition: form-data; name="file"; filename="resume.pdf"\r\n'
+               b"Content-Type: application/pdf\r\n\r\n")
+
+
+async def request(headers: list[tuple[bytes, bytes]], chunks: list[bytes]) -> tuple[int, dict]:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": "/upload-resume", "raw_path": b"/upload-resume", "query_string": b"",
+        "root_path": "", "headers": [(b"host", b"testserver"), (b"origin", ORIGIN)] + headers,
+        "client": ("127.0.0.1", 1234), "server": ("testserver", 80),
+    }
+    body = list(chunks)
+    messages = []
+
+    async def receive():
+        if body:
+            chunk = body.pop(0)
+            return {"type": "http.request", "body": chunk, "more_body": bool(body)}
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    return start["status"], {k.decode().lower(): v.decode() for k, v in start["headers"]}
+
+
+def main() -> int:
+    content_type = (b"content-type", b"multipart/form-data; boundary=x")
+    oversized = MAX_RESUME_BYTES * 2
+    cases = {
+        "content-length": ([content_type, (b"content-length", str(oversized).encode())], [b""]),
+        "streamed": (
+            [content_type, (b"transfer-encoding", b"chunked")],
+            [PART_HEADER] + [b"\0" * UPLOAD_CHUNK_SIZE] * (oversized // UPLOAD_CHUNK_SIZE),
+        ),
+    }
+    failed = False
+    for name, (headers, chunks) in cases.items():
+        status, response_headers = asyncio.run(request(headers, chunks))
+        allow_origin = response_headers.get("access-control-allow-origin")
+        ok = status == 413 and allow_origin is not None
+        failed |= not ok
+        print(f"{name:15s} status {status}, Access-Control-Allow-Origin: {allow_origin}  "
+              f"{'OK' if ok else 'FAIL'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Parity check: ONNX Runtime encoder vs the PyTorch SentenceTransformer.
+
+Embeds a fixed set of resume/JD texts (short and longer than the encoder
+window) with both backends and bounds the drift:
+  - cosine between each text's torch and ONNX vectors
+  - |torch similarity - ONNX similarity| over every text pair, which is what
+    compute_score consumes (jd_similarity_score = similarity * 25 or * 50)
+Exits non-zero if any bound is exceeded, so it can gate a deploy.
+
+Usage (from backend/, after `python -m app.onnx_encoder export -o onnx_model --quantize`):
+    python evaluation/onnx_parity.py --onnx-dir onnx_model [--quantized]
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app.embeddings import SBERT_MODEL_NAME  # noqa: E402
+from app.onnx_encoder import OnnxSentenceEncoder  # noqa: E402
+
+# (min per-text cosine, max pair-similarity drift)
+BOUNDS = {False: (0.9999, 0.001), True: (0.98, 0.02)}
+
+TEXTS = [
+    "Senior backend engineer: Python, Django, PostgreSQL, AWS, Docker.",
+    "Frontend developer with React, TypeScript and CSS experience.",
+    "Data scientist skilled in machine learning, PyTorch, pandas and SQL.",
+    "DevOps engineer: Kubernetes, Terraform, CI/CD pipelines, monitoring.",
+    "We are hiring a mobile developer to build Flutter and Swift apps.",
+    "Registered nurse with ICU experience and patient care certifications.",
+    "Accountant familiar with IFRS, audits, Excel and financial reporting.",
+    "Summary\nBackend engineer with eight years building distributed systems.\n"
+    "Experience\n" + "Designed Python microservices on Kubernetes, cut latency by 40%. " * 40,
+    "Looking for a full-stack engineer (Node.js, React, MongoDB) to join a small team. " * 12,
+]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--onnx-dir", default="onnx_model")
+    ap.add_argument("--quantized", action="store_true", help="check the int8 model")
+    args = ap.parse_args()
+
+    from sentence_transformers import SentenceTransformer
+
+    torch_vecs = SentenceTransformer(SBERT_MODEL_NAME).encode(TEXTS, normalize_embeddings=True)
+    onnx_vecs = OnnxSentenceEncoder(args.onnx_dir, quantized=args.quantized).encode(
+        TEXTS, normalize_embeddings=True)
+
+    per_text = np.sum(torch_vecs * onnx_vecs, axis=1)
+    drift = np.abs(torch_vecs @ torch_vecs.T - onnx_vecs @ onnx_vecs.T)
+    min_cos, max_drift = BOUNDS[args.quantized]
+
+    label = "int8" if args.quantized else "fp32"
+    print(f"ONNX {label} vs torch ({len(TEXTS)} texts)")
+    print(f"  per-text cosine:   min {per_text.min():.6f}  mean {per_text.mean():.6f}  (bound >= {min_cos})")
+    print(f"  pair sim drift:    max {drift.max():.6f}  mean {drift.mean():.6f}  (bound <= {max_drift})")
+    print(f"  max score drift:   {drift.max() * 50:.3f} points")
+    if per_text.min() < min_cos or drift.max() > max_drift:
+        print("FAIL")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()